@@ -11,6 +11,9 @@ extras_require = dict()
 extras_require["jax"] = [
     "jax[cpu]<0.4.2; platform_system!='Windows'",
 ]
+extras_require["numba"] = [
+    "numba>=0.54",
+]
 extras_require["zoo"] = [
     "tqdm>=4.0",
     "requests>=2.0",
@@ -22,7 +25,10 @@ extras_require["pls_calib"] = [
     "matplotlib",
 ]
 extras_require["full"] = (
-    extras_require["jax"] + extras_require["zoo"] + extras_require["pls_calib"]
+    extras_require["jax"]
+    + extras_require["numba"]
+    + extras_require["zoo"]
+    + extras_require["pls_calib"]
 )
 
 
@@ -153,6 +153,16 @@ _DEFAULT_CONFIG_OPTIONS = [
             r":obj:`True` by default."
         ),
     ),
+    (
+        "bq_belief_update_jax",
+        False,
+        (
+            r"If :obj:`True`, the standard Bayesian quadrature belief update solves its "
+            r"linear systems with JAX (requires ``jax``). The systems are padded to the "
+            r"smallest power of two not below the number of nodes such that the "
+            r"jit-compiled solve is reused across iterations."
+        ),
+    ),
 ]
 
 # ... and register the default configuration options.
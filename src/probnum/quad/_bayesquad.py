@@ -117,6 +117,19 @@ def bayesquad(
             us_rand_num_candidates : Optional[IntLike]
                 The number of candidate nodes used by the policy 'us_rand'. Defaults
                 to 1e2.
+            sparse : Optional[bool]
+                Whether to use a sparse Gaussian process approximation with
+                inducing nodes. Recommended for many evaluations. Defaults to False.
+            num_inducing : Optional[IntLike]
+                The number of inducing nodes of the sparse approximation. Defaults
+                to ``input_dim * 10``.
+            sparse_approximation : Optional[str]
+                The sparse approximation. Defaults to 'fitc'. Options are
+
+                ==================================  ========
+                 Fully independent training cond.  ``fitc``
+                 Deterministic training cond.      ``dtc``
+                ==================================  ========
 
     Returns
     -------
@@ -197,6 +210,7 @@ def bayesquad_from_data(
     measure: Optional[IntegrationMeasure] = None,
     domain: Optional[DomainLike] = None,
     options: Optional[dict] = None,
+    rng: Optional[np.random.Generator] = None,
 ) -> Tuple[Normal, BQIterInfo]:
     r"""Infer the value of an integral from a given set of nodes and function
     evaluations.
@@ -229,6 +243,22 @@ def bayesquad_from_data(
             jitter : Optional[FloatLike]
                 Non-negative jitter to numerically stabilise kernel matrix
                 inversion. Defaults to 1e-8.
+            sparse : Optional[bool]
+                Whether to use a sparse Gaussian process approximation with
+                inducing nodes. Recommended for many evaluations. Defaults to False.
+            num_inducing : Optional[IntLike]
+                The number of inducing nodes of the sparse approximation. Defaults
+                to ``input_dim * 10``.
+            sparse_approximation : Optional[str]
+                The sparse approximation. Defaults to 'fitc'. Options are
+
+                ==================================  ========
+                 Fully independent training cond.  ``fitc``
+                 Deterministic training cond.      ``dtc``
+                ==================================  ========
+    rng
+        The random number generator used to place the inducing nodes of the sparse
+        approximation.
 
     Returns
     -------
@@ -283,7 +313,7 @@ def bayesquad_from_data(
 
     # Integrate
     integral_belief, _, info = bq_method.integrate(
-        fun=None, nodes=nodes, fun_evals=fun_evals, rng=None
+        fun=None, nodes=nodes, fun_evals=fun_evals, rng=rng
     )
 
     return integral_belief, info
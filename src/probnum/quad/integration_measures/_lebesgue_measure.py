@@ -67,6 +67,8 @@ class LebesgueMeasure(IntegrationMeasure):
         n_sample: IntLike,
         rng: np.random.Generator,
     ) -> np.ndarray:
-        return self.random_variable.rvs(
-            size=(n_sample, self.input_dim), random_state=rng
+        # Equivalent to ``self.random_variable.rvs`` but avoids the overhead of the
+        # frozen scipy distribution.
+        return self.domain[0] + (self.domain[1] - self.domain[0]) * rng.uniform(
+            size=(n_sample, self.input_dim)
         )
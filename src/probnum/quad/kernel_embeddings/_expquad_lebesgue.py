@@ -50,13 +50,15 @@ def _kernel_mean_expquad_lebesgue(
     (input_dim,) = kernel.input_shape
 
     ell = kernel.lengthscale
+
+    # The error functions at both bounds for all nodes and dimensions in one call
+    erfs = erf(
+        np.stack((measure.domain[1] - x, measure.domain[0] - x)) / (ell * np.sqrt(2))
+    )
     return (
         measure.normalization_constant
         * (np.pi * ell**2 / 2) ** (input_dim / 2)
-        * (
-            erf((measure.domain[1] - x) / (ell * np.sqrt(2)))
-            - erf((measure.domain[0] - x) / (ell * np.sqrt(2)))
-        ).prod(axis=1)
+        * (erfs[0] - erfs[1]).prod(axis=1)
     )
 
 
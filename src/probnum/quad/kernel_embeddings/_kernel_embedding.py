@@ -64,6 +64,9 @@ class KernelEmbedding:
             kernel=self.kernel, measure=self.measure
         )
 
+        # The kernel variance only depends on kernel and measure and is computed once.
+        self._kernel_variance = None
+
     def kernel_mean(self, x: np.ndarray) -> np.ndarray:
         """Kernel mean w.r.t. its first argument against the integration measure.
 
@@ -89,7 +92,9 @@ class KernelEmbedding:
         kernel_variance :
             The kernel integrated w.r.t. both arguments.
         """
-        return self._kvar(kernel=self.kernel, measure=self.measure)
+        if self._kernel_variance is None:
+            self._kernel_variance = self._kvar(kernel=self.kernel, measure=self.measure)
+        return self._kernel_variance
 
     @staticmethod
     def _get_kernel_embedding(
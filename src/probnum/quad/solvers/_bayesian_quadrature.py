@@ -11,7 +11,11 @@ from probnum.quad.integration_measures import IntegrationMeasure, LebesgueMeasur
 from probnum.quad.kernel_embeddings import KernelEmbedding
 from probnum.quad.solvers._bq_state import BQIterInfo, BQState
 from probnum.quad.solvers.acquisition_functions import WeightedPredictiveVariance
-from probnum.quad.solvers.belief_updates import BQBeliefUpdate, BQStandardBeliefUpdate
+from probnum.quad.solvers.belief_updates import (
+    BQBeliefUpdate,
+    BQSparseBeliefUpdate,
+    BQStandardBeliefUpdate,
+)
 from probnum.quad.solvers.initial_designs import InitialDesign, LatinDesign, MCDesign
 from probnum.quad.solvers.policies import (
     Policy,
@@ -148,6 +152,14 @@ class BayesianQuadrature:
                 us_rand_num_candidates : Optional[IntLike]
                     The number of candidate nodes used by the policy 'us_rand'. Defaults
                     to 1e2.
+                sparse : Optional[bool]
+                    Whether to use a sparse Gaussian process approximation with
+                    inducing nodes. Defaults to False.
+                num_inducing : Optional[IntLike]
+                    The number of inducing nodes of the sparse approximation. Defaults
+                    to ``input_dim * 10``.
+                sparse_approximation : Optional[str]
+                    The sparse approximation, 'fitc' or 'dtc'. Defaults to 'fitc'.
 
         Returns
         -------
@@ -160,6 +172,8 @@ class BayesianQuadrature:
             If an unknown ``policy`` or an unknown ``initial_design`` is given.
         ValueError
             If neither ``domain`` nor ``measure`` is given.
+        ValueError
+            If the sparse approximation is used with the policy 'us_rand'.
 
         See Also
         --------
@@ -185,6 +199,9 @@ class BayesianQuadrature:
             "num_initial_design_nodes", int(5 * input_dim)
         )
         us_rand_num_candidates = options.get("us_rand_num_candidates", int(1e2))
+        sparse = options.get("sparse", False)
+        num_inducing = options.get("num_inducing", int(10 * input_dim))
+        sparse_approximation = options.get("sparse_approximation", "fitc")
 
         # Set up integration measure
         if domain is None and measure is None:
@@ -205,22 +222,50 @@ class BayesianQuadrature:
             # require an acquisition loop. The error handling is done in ``integrate``.
             pass
         elif policy == "bmc":
-            policy = RandomPolicy(batch_size, measure.sample)
+            # The number of iterations is known if ``max_evals`` is the only stopping
+            # criterion, such that the nodes of all iterations can be sampled at once.
+            num_pooled_batches = None
+            if max_evals is not None and var_tol is None and rel_tol is None:
+                num_policy_evals = max_evals
+                if initial_design is not None:
+                    num_policy_evals -= num_initial_design_nodes
+                num_pooled_batches = int(np.ceil(num_policy_evals / batch_size))
+            policy = RandomPolicy(
+                batch_size, measure.sample, num_pooled_batches=num_pooled_batches
+            )
         elif policy == "vdc":
             policy = VanDerCorputPolicy(batch_size, measure)
         elif policy == "us_rand":
             policy = RandomMaxAcquisitionPolicy(
-                batch_size=1,
+                batch_size=batch_size,
                 acquisition_func=WeightedPredictiveVariance(),
                 n_candidates=us_rand_num_candidates,
+                jitter=jitter,
             )
         else:
             raise NotImplementedError(f"The given policy ({policy}) is unknown.")
 
-        # Select the belief updater
-        belief_update = BQStandardBeliefUpdate(
-            jitter=jitter, scale_estimation=scale_estimation
-        )
+        # Select the belief updater. The inducing nodes of the sparse approximation
+        # fill the domain if it is bounded.
+        if sparse:
+            if isinstance(policy, RandomMaxAcquisitionPolicy):
+                raise ValueError(
+                    "The policy 'us_rand' cannot be used with the sparse approximation."
+                )
+            if np.all(np.isfinite(measure.domain)):
+                inducing_design = LatinDesign(num_inducing, measure)
+            else:
+                inducing_design = MCDesign(num_inducing, measure)
+            belief_update = BQSparseBeliefUpdate(
+                jitter=jitter,
+                scale_estimation=scale_estimation,
+                inducing_design=inducing_design,
+                approximation=sparse_approximation,
+            )
+        else:
+            belief_update = BQStandardBeliefUpdate(
+                jitter=jitter, scale_estimation=scale_estimation
+            )
 
         # Select stopping criterion: If multiple stopping criteria are given, BQ stops
         # once any criterion is fulfilled (logical `or`).
@@ -321,21 +366,37 @@ class BayesianQuadrature:
             if _has_converged:
                 break
 
-            # Select new nodes via policy
-            new_nodes = self.policy(bq_state, rng)
+            bq_state, info = self._step(bq_state, info, fun, rng)
 
-            # Evaluate the integrand at new nodes
-            new_fun_evals = fun(new_nodes)
+    def _step(
+        self,
+        bq_state: BQState,
+        info: BQIterInfo,
+        fun: Callable,
+        rng: Optional[np.random.Generator],
+    ) -> Tuple[BQState, BQIterInfo]:
+        """Perform one iteration of the BQ loop.
 
-            # Update the belief about the integrand
-            _, bq_state = self.belief_update(
-                bq_state=bq_state,
-                new_nodes=new_nodes,
-                new_fun_evals=new_fun_evals,
-            )
+        No inputs are checked here. All checks are done once in ``integrate``.
+        """
+
+        # Select new nodes via policy
+        new_nodes = self.policy(bq_state, rng)
+
+        # Evaluate the integrand at new nodes
+        new_fun_evals = fun(new_nodes)
+
+        # Update the belief about the integrand
+        _, bq_state = self.belief_update(
+            bq_state=bq_state,
+            new_nodes=new_nodes,
+            new_fun_evals=new_fun_evals,
+            rng=rng,
+        )
 
-            # Update the state of the iteration
-            info = BQIterInfo.from_iteration(info=info, dnevals=self.policy.batch_size)
+        # Update the state of the iteration
+        info = BQIterInfo.from_iteration(info=info, dnevals=self.policy.batch_size)
+        return bq_state, info
 
     def integrate(
         self,
@@ -387,7 +448,8 @@ class BayesianQuadrature:
             If dimension of ``nodes`` or ``fun_evals`` is incorrect, or if their
             shapes do not match.
         ValueError
-            If ``rng`` is not given but ``policy`` or ``initial_design`` requires it.
+            If ``rng`` is not given but ``policy``, ``initial_design`` or
+            ``belief_update`` requires it.
         ValueError
             If a policy is available but ``fun`` is not given.
         ValueError
@@ -407,53 +469,18 @@ class BayesianQuadrature:
 
         """
 
-        # Check if integrand function is provided
-        if fun is None and fun_evals is None:
-            raise ValueError(
-                "Please provide an integrand function 'fun' or function values "
-                "'fun_evals'."
-            )
+        self._check_integrate_inputs(fun=fun, nodes=nodes, fun_evals=fun_evals, rng=rng)
+
+        if self.policy is not None:
+            self.policy.reset()
 
         # Setup fixed design
         if nodes is not None and fun_evals is None:
             fun_evals = fun(nodes)
-
-        # Check if shapes of nodes and function evaluations match
-        if fun_evals is not None and fun_evals.ndim != 1:
-            raise ValueError(
-                f"fun_evals must be one-dimensional " f"({fun_evals.ndim})."
-            )
-        if nodes is not None and nodes.ndim != 2:
-            raise ValueError(f"nodes must be two-dimensional ({nodes.ndim}).")
-
-        if nodes is not None and fun_evals is not None:
-            if nodes.shape[0] != fun_evals.shape[0]:
-                raise ValueError(
-                    f"nodes ({nodes.shape[0]}) and fun_evals "
-                    f"({fun_evals.shape[0]}) need to contain the same number "
-                    f"of evaluations."
-                )
-
-        # policy given
-        if self.policy is not None:
-
-            # function handle must be given for policy to work
-            if fun is None:
-                raise ValueError("Policy requires ``fun`` to be given.")
-
-            # some policies require and rng
-            if self.policy.requires_rng and rng is None:
-                raise ValueError(
-                    f"The policy '{self.policy.__class__.__name__}' requires a random "
-                    f"number generator (rng) to be given."
-                )
+            self._check_data(nodes=nodes, fun_evals=fun_evals)
 
         # no policy given: Integrate on fixed dataset.
-        else:
-            # nodes must be provided if no policy is given.
-            if nodes is None:
-                raise ValueError("No policy available: Please provide nodes.")
-
+        if self.policy is None:
             # Use fun_evals and disregard fun if both are given
             if fun is not None and fun_evals is not None:
                 warnings.warn(
@@ -466,14 +493,6 @@ class BayesianQuadrature:
 
         # initial design given (which implies policy and fun is given)
         if self.initial_design is not None:
-
-            # some designs require and rng
-            if self.initial_design.requires_rng and rng is None:
-                raise ValueError(
-                    f"The initial design '{self.initial_design.__class__.__name__}' "
-                    f"requires a random number generator (rng) to be given."
-                )
-
             initial_design_nodes = self.initial_design(rng)
             initial_design_fun_evals = fun(initial_design_nodes)
             if nodes is not None:
@@ -483,13 +502,22 @@ class BayesianQuadrature:
                 nodes = initial_design_nodes
                 fun_evals = initial_design_fun_evals
 
-        # set BQ state: This encodes a zero-mean prior.
+        # set BQ state: This encodes a zero-mean prior. Storage for the nodes is
+        # preallocated if the maximum number of evaluations is known. The last batch
+        # may exceed it by up to ``batch_size - 1`` nodes.
+        capacity = None
+        if isinstance(self.stopping_criterion, MaxNevals):
+            capacity = self.stopping_criterion.max_nevals
+            if self.policy is not None:
+                capacity += self.policy.batch_size - 1
+
         bq_state = BQState(
             measure=self.measure,
             kernel=self.kernel,
             integral_belief=Normal(
                 0.0, KernelEmbedding(self.kernel, self.measure).kernel_variance()
             ),
+            capacity=capacity,
         )
 
         # update BQ state if nodes and evaluations are available
@@ -498,6 +526,7 @@ class BayesianQuadrature:
                 bq_state=bq_state,
                 new_nodes=nodes,
                 new_fun_evals=fun_evals,
+                rng=rng,
             )
 
         # set iteration info
@@ -508,3 +537,84 @@ class BayesianQuadrature:
             pass
 
         return bq_state.integral_belief, bq_state, info
+
+    def _check_integrate_inputs(
+        self,
+        fun: Optional[Callable],
+        nodes: Optional[np.ndarray],
+        fun_evals: Optional[np.ndarray],
+        rng: Optional[np.random.Generator],
+    ) -> None:
+        """Check the inputs of ``integrate``.
+
+        See ``integrate`` for the parameters and the exceptions raised.
+        """
+
+        # Check if integrand function is provided
+        if fun is None and fun_evals is None:
+            raise ValueError(
+                "Please provide an integrand function 'fun' or function values "
+                "'fun_evals'."
+            )
+
+        self._check_data(nodes=nodes, fun_evals=fun_evals)
+
+        # policy given
+        if self.policy is not None:
+
+            # function handle must be given for policy to work
+            if fun is None:
+                raise ValueError("Policy requires ``fun`` to be given.")
+
+            # some policies require and rng
+            if self.policy.requires_rng and rng is None:
+                raise ValueError(
+                    f"The policy '{self.policy.__class__.__name__}' requires a random "
+                    f"number generator (rng) to be given."
+                )
+
+        # no policy given: nodes must be provided.
+        elif nodes is None:
+            raise ValueError("No policy available: Please provide nodes.")
+
+        # initial design given: some designs require and rng
+        if self.initial_design is not None:
+            if self.initial_design.requires_rng and rng is None:
+                raise ValueError(
+                    f"The initial design '{self.initial_design.__class__.__name__}' "
+                    f"requires a random number generator (rng) to be given."
+                )
+
+        # some belief updates require an rng
+        if self.belief_update.requires_rng and rng is None:
+            raise ValueError(
+                f"The belief update '{self.belief_update.__class__.__name__}' "
+                f"requires a random number generator (rng) to be given."
+            )
+
+    @staticmethod
+    def _check_data(nodes: Optional[np.ndarray], fun_evals: Optional[np.ndarray]):
+        """Check the shapes of the nodes and the function evaluations.
+
+        Raises
+        ------
+        ValueError
+            If dimension of ``nodes`` or ``fun_evals`` is incorrect, or if their
+            shapes do not match.
+        """
+
+        # Check if shapes of nodes and function evaluations match
+        if fun_evals is not None and fun_evals.ndim != 1:
+            raise ValueError(
+                f"fun_evals must be one-dimensional " f"({fun_evals.ndim})."
+            )
+        if nodes is not None and nodes.ndim != 2:
+            raise ValueError(f"nodes must be two-dimensional ({nodes.ndim}).")
+
+        if nodes is not None and fun_evals is not None:
+            if nodes.shape[0] != fun_evals.shape[0]:
+                raise ValueError(
+                    f"nodes ({nodes.shape[0]}) and fun_evals "
+                    f"({fun_evals.shape[0]}) need to contain the same number "
+                    f"of evaluations."
+                )
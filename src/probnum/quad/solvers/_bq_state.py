@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
+from collections.abc import Sequence
 from dataclasses import dataclass
-from typing import Optional, Tuple
+from typing import Optional, Tuple, Union
 
 import numpy as np
 
@@ -11,7 +12,7 @@ from probnum.quad.integration_measures import IntegrationMeasure
 from probnum.quad.kernel_embeddings import KernelEmbedding
 from probnum.randprocs.kernels import Kernel
 from probnum.randvars import Normal
-from probnum.typing import FloatLike
+from probnum.typing import FloatLike, IntLike
 
 # pylint: disable=too-few-public-methods,too-many-instance-attributes
 
@@ -41,31 +42,84 @@ class BQState:
         The output of BQBeliefUpdate.compute_gram_cho_factor.
     kernel_means
         All kernel mean evaluations at ``nodes``.
+    inducing_nodes
+        Inducing nodes of a sparse approximation of the BQ belief. If given,
+        ``gram``, ``gram_cho_factor`` and ``kernel_means`` are not available.
+    inducing_gram_cho_factor
+        The output of BQBeliefUpdate.compute_gram_cho_factor for the Gram matrix of
+        ``inducing_nodes``.
+    inducing_kernel_means
+        All kernel mean evaluations at ``inducing_nodes``.
+    inducing_cross_precision
+        The cross-covariances of ``inducing_nodes`` and ``nodes``, whitened with the
+        Cholesky factor in ``inducing_gram_cho_factor`` and weighted with the inverse
+        diagonal correction of the sparse approximation, multiplied with their
+        transpose.
+    inducing_cross_fun_evals
+        The whitened and weighted cross-covariances as in
+        ``inducing_cross_precision`` multiplied with ``fun_evals``.
+    fun_evals_precision_norm
+        The squared norm of ``fun_evals`` weighted with the inverse diagonal
+        correction of the sparse approximation.
+    capacity
+        Number of nodes for which storage is preallocated once new data is added.
+        The storage grows geometrically if more nodes are added. Defaults to the
+        number of nodes after the first update.
 
     See Also
     --------
     BQIterInfo : Container for quantities concerning the BQ loop iteration.
     """
 
+    __slots__ = (
+        "measure",
+        "kernel",
+        "kernel_embedding",
+        "scale_sq",
+        "integral_belief",
+        "_previous_integral_beliefs",
+        "input_dim",
+        "nodes",
+        "fun_evals",
+        "gram",
+        "gram_cho_factor",
+        "kernel_means",
+        "inducing_nodes",
+        "inducing_gram_cho_factor",
+        "inducing_kernel_means",
+        "inducing_cross_precision",
+        "inducing_cross_fun_evals",
+        "fun_evals_precision_norm",
+        "_capacity",
+        "_buffers",
+    )
+
     def __init__(
         self,
         measure: IntegrationMeasure,
         kernel: Kernel,
         scale_sq: FloatLike = 1.0,
         integral_belief: Optional[Normal] = None,
-        previous_integral_beliefs: Tuple[Normal] = (),
+        previous_integral_beliefs: Sequence[Normal] = (),
         nodes: Optional[np.ndarray] = None,
         fun_evals: Optional[np.ndarray] = None,
         gram: np.ndarray = np.array([[]]),
         gram_cho_factor: Tuple[np.ndarray, bool] = (np.array([[]]), False),
         kernel_means: np.ndarray = np.array([]),
+        inducing_nodes: Optional[np.ndarray] = None,
+        inducing_gram_cho_factor: Tuple[np.ndarray, bool] = (np.array([[]]), False),
+        inducing_kernel_means: np.ndarray = np.array([]),
+        inducing_cross_precision: np.ndarray = np.array([[]]),
+        inducing_cross_fun_evals: np.ndarray = np.array([]),
+        fun_evals_precision_norm: FloatLike = 0.0,
+        capacity: Optional[IntLike] = None,
     ):
         self.measure = measure
         self.kernel = kernel
         self.kernel_embedding = KernelEmbedding(kernel, measure)
         self.scale_sq = scale_sq
         self.integral_belief = integral_belief
-        self.previous_integral_beliefs = previous_integral_beliefs
+        self._previous_integral_beliefs = previous_integral_beliefs
         self.input_dim = measure.input_dim
 
         if nodes is None:
@@ -78,6 +132,79 @@ class BQState:
         self.gram = gram
         self.gram_cho_factor = gram_cho_factor
         self.kernel_means = kernel_means
+        self.inducing_nodes = inducing_nodes
+        self.inducing_gram_cho_factor = inducing_gram_cho_factor
+        self.inducing_kernel_means = inducing_kernel_means
+        self.inducing_cross_precision = inducing_cross_precision
+        self.inducing_cross_fun_evals = inducing_cross_fun_evals
+        self.fun_evals_precision_norm = fun_evals_precision_norm
+
+        self._capacity = 0 if capacity is None else int(capacity)
+        self._buffers = None
+
+    @property
+    def nevals(self) -> int:
+        """Number of function evaluations."""
+        return self.fun_evals.shape[0]
+
+    @property
+    def previous_integral_beliefs(self) -> Sequence[Normal]:
+        """Integral beliefs computed on previous iterations."""
+        return self._previous_integral_beliefs
+
+    def _reserve(
+        self, num_new: int, discard_derived: bool = False, with_gram: bool = True
+    ) -> "_BQBuffers":
+        """Get storage for the data of this state and ``num_new`` additional nodes.
+
+        The data of this state occupies the leading part of the returned buffers. The
+        buffers are shared with the states derived from this state, which hold views
+        into them. If this state is not the latest state using the buffers, the data is
+        copied to new buffers such that the derived states remain unchanged.
+
+        Parameters
+        ----------
+        num_new
+            Number of nodes to be added.
+        discard_derived
+            Whether the data derived from the nodes (Gram matrix, its Cholesky factor
+            and kernel means) is recomputed for all nodes. If so, and this state has
+            nodes, new buffers are allocated into which only the nodes and function
+            evaluations are copied. This state, which holds views into the current
+            buffers, remains unchanged.
+        with_gram
+            Whether storage for the Gram matrix and its Cholesky factor is needed.
+
+        Returns
+        -------
+        buffers :
+            Storage for ``nevals + num_new`` nodes, where ``nevals`` is the number of
+            nodes of this state.
+        """
+        num_nodes = self.nevals
+        num_total = num_nodes + num_new
+
+        buffers = self._buffers
+        if (
+            buffers is None
+            or (discard_derived and num_nodes > 0)
+            or (with_gram and buffers.gram is None)
+            or buffers.size != num_nodes
+            or buffers.num_beliefs != len(self._previous_integral_beliefs)
+            or (num_nodes > 0 and self.nodes.base is not buffers.nodes)
+        ):
+            buffers = _BQBuffers.from_state(
+                self,
+                capacity=max(self._capacity, num_total),
+                copy_derived=not discard_derived,
+                with_gram=with_gram,
+            )
+        elif buffers.capacity < num_total:
+            buffers.resize(max(2 * buffers.capacity, num_total))
+
+        buffers.size = num_total
+        self._buffers = buffers
+        return buffers
 
     @classmethod
     def from_new_data(
@@ -88,9 +215,15 @@ class BQState:
         fun_evals: np.ndarray,
         integral_belief: Normal,
         prev_state: "BQState",
-        gram: np.ndarray,
-        gram_cho_factor: Tuple[np.ndarray, bool],
-        kernel_means: np.ndarray,
+        gram: np.ndarray = np.array([[]]),
+        gram_cho_factor: Tuple[np.ndarray, bool] = (np.array([[]]), False),
+        kernel_means: np.ndarray = np.array([]),
+        inducing_nodes: Optional[np.ndarray] = None,
+        inducing_gram_cho_factor: Tuple[np.ndarray, bool] = (np.array([[]]), False),
+        inducing_kernel_means: np.ndarray = np.array([]),
+        inducing_cross_precision: np.ndarray = np.array([[]]),
+        inducing_cross_fun_evals: np.ndarray = np.array([]),
+        fun_evals_precision_norm: FloatLike = 0.0,
     ) -> "BQState":
         r"""Initialize state from updated data.
 
@@ -114,25 +247,262 @@ class BQState:
             The output of BQBeliefUpdate.compute_gram_cho_factor for ``gram``.
         kernel_means
             The kernel means at the given nodes.
+        inducing_nodes
+            The inducing nodes if the belief is a sparse approximation.
+        inducing_gram_cho_factor
+            The Cholesky factor of the Gram matrix of the inducing nodes.
+        inducing_kernel_means
+            The kernel means at the inducing nodes.
+        inducing_cross_precision
+            The weighted Gram matrix of the whitened cross-covariances of the
+            inducing nodes and the nodes.
+        inducing_cross_fun_evals
+            The weighted whitened cross-covariances times the function evaluations.
+        fun_evals_precision_norm
+            The weighted squared norm of the function evaluations.
 
         Returns
         -------
         bq_state :
             An instance of this class.
         """
-        return cls(
+        # Append the previous belief in place if the storage of ``prev_state`` was
+        # reserved for the new data, otherwise fall back to a new tuple.
+        # pylint: disable=protected-access
+        buffers = prev_state._buffers
+        if (
+            buffers is not None
+            and buffers.size == nodes.shape[0]
+            and buffers.num_beliefs == len(prev_state._previous_integral_beliefs)
+        ):
+            previous_integral_beliefs = buffers.append_integral_belief(
+                prev_state.integral_belief
+            )
+        else:
+            previous_integral_beliefs = tuple(prev_state.previous_integral_beliefs) + (
+                prev_state.integral_belief,
+            )
+
+        bq_state = cls(
             measure=prev_state.measure,
             kernel=kernel,
             scale_sq=scale_sq,
             integral_belief=integral_belief,
-            previous_integral_beliefs=prev_state.previous_integral_beliefs
-            + (prev_state.integral_belief,),
+            previous_integral_beliefs=previous_integral_beliefs,
             nodes=nodes,
             fun_evals=fun_evals,
             gram=gram,
             gram_cho_factor=gram_cho_factor,
             kernel_means=kernel_means,
+            inducing_nodes=inducing_nodes,
+            inducing_gram_cho_factor=inducing_gram_cho_factor,
+            inducing_kernel_means=inducing_kernel_means,
+            inducing_cross_precision=inducing_cross_precision,
+            inducing_cross_fun_evals=inducing_cross_fun_evals,
+            fun_evals_precision_norm=fun_evals_precision_norm,
+            capacity=prev_state._capacity,
+        )
+        bq_state._buffers = buffers
+
+        # Keep the kernel embedding and its cached quantities if nothing changed
+        if (
+            prev_state.kernel_embedding.kernel is kernel
+            and prev_state.kernel_embedding.measure is bq_state.measure
+        ):
+            bq_state.kernel_embedding = prev_state.kernel_embedding
+        return bq_state
+
+
+class _BQBuffers:
+    """Preallocated storage for the data of consecutive BQ states.
+
+    Parameters
+    ----------
+    capacity
+        Number of nodes that fit into the buffers.
+    input_dim
+        Input dimension of the nodes.
+    with_gram
+        Whether to allocate storage for the Gram matrix and its Cholesky factor.
+        Otherwise, ``gram`` and ``gram_cho`` are None.
+    """
+
+    def __init__(self, capacity: int, input_dim: int, with_gram: bool = True) -> None:
+        self.nodes = np.empty((capacity, input_dim))
+        self.fun_evals = np.empty((capacity,))
+        self.gram = np.empty((capacity, capacity)) if with_gram else None
+        self.gram_cho = np.zeros((capacity, capacity)) if with_gram else None
+        self.kernel_means = np.empty((capacity,))
+        self.integral_means = np.empty((capacity,))
+        self.integral_variances = np.empty((capacity,))
+        self.integral_beliefs_missing = np.empty((capacity,), dtype=bool)
+        self._rhs = np.empty((2 * capacity,))
+        self.size = 0
+        self.num_beliefs = 0
+
+    @property
+    def capacity(self) -> int:
+        """Number of nodes that fit into the buffers."""
+        return self.fun_evals.shape[0]
+
+    @classmethod
+    def from_state(
+        cls,
+        bq_state: BQState,
+        capacity: int,
+        copy_derived: bool = True,
+        with_gram: bool = True,
+    ) -> "_BQBuffers":
+        """Allocate buffers and copy the data of a BQ state into them.
+
+        The data derived from the nodes is only copied if ``copy_derived`` is True.
+        """
+        num_nodes = bq_state.nevals
+        buffers = cls(
+            capacity=max(capacity, num_nodes),
+            input_dim=bq_state.input_dim,
+            with_gram=with_gram,
+        )
+        buffers.nodes[:num_nodes] = bq_state.nodes
+        buffers.fun_evals[:num_nodes] = bq_state.fun_evals
+
+        # Data derived from the nodes is only available once a belief update ran.
+        if copy_derived and with_gram:
+            if bq_state.gram.shape == (num_nodes, num_nodes):
+                buffers.gram[:num_nodes, :num_nodes] = bq_state.gram
+            if bq_state.gram_cho_factor[0].shape == (num_nodes, num_nodes):
+                buffers.gram_cho[:num_nodes, :num_nodes] = bq_state.gram_cho_factor[0]
+            if bq_state.kernel_means.shape == (num_nodes,):
+                buffers.kernel_means[:num_nodes] = bq_state.kernel_means
+        buffers.size = num_nodes
+
+        # pylint: disable=protected-access
+        for integral_belief in bq_state._previous_integral_beliefs:
+            buffers.append_integral_belief(integral_belief)
+        return buffers
+
+    def append_integral_belief(
+        self, integral_belief: Optional[Normal]
+    ) -> "_IntegralBeliefs":
+        """Store the mean and variance of an integral belief after the stored ones.
+
+        Parameters
+        ----------
+        integral_belief
+            The scalar integral belief to store.
+
+        Returns
+        -------
+        integral_beliefs :
+            View of all stored integral beliefs.
+        """
+        if self.num_beliefs == self.integral_means.shape[0]:
+            capacity = max(2 * self.num_beliefs, 1)
+            for name in (
+                "integral_means",
+                "integral_variances",
+                "integral_beliefs_missing",
+            ):
+                values = np.empty((capacity,), dtype=getattr(self, name).dtype)
+                values[: self.num_beliefs] = getattr(self, name)
+                setattr(self, name, values)
+
+        if integral_belief is None:
+            self.integral_beliefs_missing[self.num_beliefs] = True
+        else:
+            self.integral_means[self.num_beliefs] = integral_belief.mean
+            self.integral_variances[self.num_beliefs] = integral_belief.var
+            self.integral_beliefs_missing[self.num_beliefs] = False
+        self.num_beliefs += 1
+
+        return _IntegralBeliefs(
+            self.integral_means[: self.num_beliefs],
+            self.integral_variances[: self.num_beliefs],
+            self.integral_beliefs_missing[: self.num_beliefs],
+        )
+
+    def resize(self, capacity: int) -> None:
+        """Grow the buffers to a new capacity keeping the stored data."""
+        size = self.size
+        new_buffers = _BQBuffers(
+            capacity=capacity,
+            input_dim=self.nodes.shape[1],
+            with_gram=self.gram is not None,
         )
+        new_buffers.nodes[:size] = self.nodes[:size]
+        new_buffers.fun_evals[:size] = self.fun_evals[:size]
+        if self.gram is not None:
+            new_buffers.gram[:size, :size] = self.gram[:size, :size]
+            new_buffers.gram_cho[:size, :size] = self.gram_cho[:size, :size]
+        new_buffers.kernel_means[:size] = self.kernel_means[:size]
+
+        self.nodes = new_buffers.nodes
+        self.fun_evals = new_buffers.fun_evals
+        self.gram = new_buffers.gram
+        self.gram_cho = new_buffers.gram_cho
+        self.kernel_means = new_buffers.kernel_means
+        self._rhs = new_buffers._rhs  # pylint: disable=protected-access
+
+    def gram_rhs(self, num_nodes: int, num_rhs: int) -> np.ndarray:
+        """Storage for right hand sides of linear systems of the Gram matrix.
+
+        The returned array is Fortran-contiguous such that the systems can be solved
+        in place. Its content is overwritten by the next call.
+
+        Parameters
+        ----------
+        num_nodes
+            Number of nodes, i.e., size of the Gram matrix.
+        num_rhs
+            Number of right hand sides (at most 2).
+
+        Returns
+        -------
+        rhs :
+            *shape=(num_nodes, num_rhs)* -- Uninitialized right hand sides.
+        """
+        return self._rhs[: num_rhs * num_nodes].reshape((num_rhs, num_nodes)).T
+
+
+class _IntegralBeliefs(Sequence):
+    """Read-only sequence of scalar integral beliefs stored as means and variances.
+
+    The beliefs are created on access. Missing beliefs are returned as ``None``.
+
+    Parameters
+    ----------
+    means
+        *shape=(num_beliefs,)* -- Means of the integral beliefs.
+    variances
+        *shape=(num_beliefs,)* -- Variances of the integral beliefs.
+    missing
+        *shape=(num_beliefs,)* -- Whether a belief is missing. The mean and variance
+        of a missing belief are undefined.
+    """
+
+    __slots__ = ("_means", "_variances", "_missing")
+
+    def __init__(
+        self, means: np.ndarray, variances: np.ndarray, missing: np.ndarray
+    ) -> None:
+        self._means = means
+        self._variances = variances
+        self._missing = missing
+
+    def __len__(self) -> int:
+        return self._means.shape[0]
+
+    def __getitem__(
+        self, index: Union[int, slice]
+    ) -> Union[Optional[Normal], "_IntegralBeliefs"]:
+        if isinstance(index, slice):
+            return _IntegralBeliefs(
+                self._means[index], self._variances[index], self._missing[index]
+            )
+
+        if self._missing[index]:
+            return None
+        return Normal(mean=self._means[index], cov=self._variances[index])
 
 
 @dataclass
@@ -25,6 +25,9 @@ class WeightedPredictiveVariance(AcquisitionFunction):
     where :math:`\operatorname{Var}(f(x))` is the predictive variance of the model and
     :math:`p(x)` is the density of the integration measure :math:`\mu`.
 
+    The predictive variance requires the Gram matrix of the nodes. Hence, states of a
+    sparse approximation (with inducing nodes) are not supported.
+
     """
 
     @property
@@ -37,12 +40,20 @@ class WeightedPredictiveVariance(AcquisitionFunction):
         x: np.ndarray,
         bq_state: BQState,
     ) -> Tuple[np.ndarray, Optional[np.ndarray]]:
-        predictive_variance = bq_state.kernel(x, x)
+        if bq_state.inducing_nodes is not None:
+            raise ValueError(
+                "The predictive variance is not available for states of a sparse "
+                "approximation."
+            )
+
+        # All candidate nodes are handled at once: a single cross-kernel matrix and a
+        # single solve with the cached Cholesky factor of the Gram matrix.
+        predictive_variance = bq_state.kernel(x, None)
         if bq_state.fun_evals.shape != (0,):
             kXx = bq_state.kernel.matrix(bq_state.nodes, x)
             regression_weights = BQStandardBeliefUpdate.gram_cho_solve(
                 bq_state.gram_cho_factor, kXx
             )
-            predictive_variance -= np.sum(regression_weights * kXx, axis=0)
+            predictive_variance -= np.einsum("ij,ij->j", regression_weights, kXx)
         values = bq_state.scale_sq * predictive_variance * bq_state.measure(x) ** 2
         return values, None
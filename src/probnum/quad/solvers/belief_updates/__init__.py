@@ -1,14 +1,17 @@
 """Belief updates for Bayesian quadrature."""
 
 from ._belief_update import BQBeliefUpdate
+from ._sparse_update import BQSparseBeliefUpdate
 from ._standard_update import BQStandardBeliefUpdate
 
 # Public classes and functions. Order is reflected in documentation.
 __all__ = [
     "BQBeliefUpdate",
     "BQStandardBeliefUpdate",
+    "BQSparseBeliefUpdate",
 ]
 
 # Set correct module paths. Corrects links and module paths in documentation.
 BQBeliefUpdate.__module__ = "probnum.quad.solvers.belief_updates"
 BQStandardBeliefUpdate.__module__ = "probnum.quad.solvers.belief_updates"
+BQSparseBeliefUpdate.__module__ = "probnum.quad.solvers.belief_updates"
@@ -3,10 +3,10 @@
 from __future__ import annotations
 
 import abc
-from typing import Tuple
+from typing import Optional, Tuple
 
 import numpy as np
-from scipy.linalg import cho_factor, cho_solve
+from scipy.linalg import cho_factor, cho_solve, solve_triangular
 
 from probnum.quad.solvers._bq_state import BQState
 from probnum.randvars import Normal
@@ -28,6 +28,12 @@ class BQBeliefUpdate(abc.ABC):
             raise ValueError(f"Jitter ({jitter}) must be non-negative.")
         self.jitter = float(jitter)
 
+    @property
+    def requires_rng(self) -> bool:
+        """Whether the belief update requires a random number generator when
+        called."""
+        return False
+
     @abc.abstractmethod
     def __call__(
         self,
@@ -58,6 +64,18 @@ class BQBeliefUpdate(abc.ABC):
         """
         raise NotImplementedError
 
+    @staticmethod
+    def _check_fun_evals(fun_evals: np.ndarray) -> None:
+        """Check that function evaluations are finite.
+
+        Raises
+        ------
+        ValueError
+            If ``fun_evals`` contains infs or NaNs.
+        """
+        if not np.isfinite(fun_evals).all():
+            raise ValueError("The function evaluations must not contain infs or NaNs.")
+
     def compute_gram_cho_factor(self, gram: np.ndarray) -> Tuple[np.ndarray, bool]:
         """Compute the Cholesky decomposition of a positive-definite Gram matrix for use
         in scipy.linalg.cho_solve
@@ -74,25 +92,105 @@ class BQBeliefUpdate(abc.ABC):
         Returns
         -------
         gram_cho_factor :
-            The upper triangular Cholesky decomposition of the Gram matrix. Other
+            The lower triangular Cholesky decomposition of the Gram matrix. Other
             parts of the matrix contain random data. A boolean that indicates whether
-            the matrix is lower triangular (always False but needed for scipy).
+            the matrix is lower triangular (always True but needed for scipy).
+        """
+        return cho_factor(
+            gram + self.jitter * np.eye(gram.shape[0]),
+            lower=True,
+            overwrite_a=True,
+            check_finite=False,
+        )
+
+    def update_gram_cho_factor(
+        self,
+        gram_cho_factor: Tuple[np.ndarray, bool],
+        gram_old_new: np.ndarray,
+        gram_new_new: np.ndarray,
+        out: Optional[np.ndarray] = None,
+    ) -> Tuple[np.ndarray, bool]:
+        r"""Extend the Cholesky decomposition of a Gram matrix by new rows and columns.
+
+        Given the lower Cholesky factor :math:`L` of the Gram matrix :math:`K` of the
+        old nodes, the factor of the extended Gram matrix is
+
+        .. math::
+            \begin{bmatrix} K & K_{12} \\ K_{12}^\top & K_{22} \end{bmatrix}
+            =
+            \begin{bmatrix} L & 0 \\ L_{12}^\top & L_{22} \end{bmatrix}
+            \begin{bmatrix} L^\top & L_{12} \\ 0 & L_{22}^\top \end{bmatrix}
+
+        with :math:`L_{12} = L^{-1} K_{12}` and :math:`L_{22}` the Cholesky factor of
+        :math:`K_{22} - L_{12}^\top L_{12}`. This costs
+        :math:`\mathcal{O}(n^2 b)` instead of :math:`\mathcal{O}((n + b)^3)` for
+        :math:`n` old and :math:`b` new nodes.
+
+        .. warning::
+            The returned matrix is only to be used in scipy.linalg.cho_solve.
+
+        Parameters
+        ----------
+        gram_cho_factor
+            The lower triangular output of compute_gram_cho_factor for the Gram matrix
+            of the old nodes, shape (nevals, nevals).
+        gram_old_new
+            Kernel matrix between the old and the new nodes, shape (nevals, nevals_new).
+        gram_new_new
+            Kernel Gram matrix of the new nodes, shape (nevals_new, nevals_new).
+        out
+            Optional array of shape (nevals + nevals_new, nevals + nevals_new) the
+            result is written to. Its leading block may already hold the factor of the
+            old Gram matrix, in which case it is not copied.
+
+        Returns
+        -------
+        gram_cho_factor :
+            The lower triangular Cholesky decomposition of the extended Gram matrix.
+            Other parts of the matrix contain random data. A boolean that indicates
+            whether the matrix is lower triangular (always True but needed for scipy).
         """
-        return cho_factor(gram + self.jitter * np.eye(gram.shape[0]))
+        cho_old, _ = gram_cho_factor
+        n_old, n_new = gram_old_new.shape
+
+        cho_old_new = solve_triangular(
+            cho_old, gram_old_new, lower=True, check_finite=False
+        )
+        cho_new_new, _ = cho_factor(
+            gram_new_new + self.jitter * np.eye(n_new) - cho_old_new.T @ cho_old_new,
+            lower=True,
+            overwrite_a=True,
+            check_finite=False,
+        )
+
+        cho = np.zeros((n_old + n_new, n_old + n_new)) if out is None else out
+        if not np.may_share_memory(cho, cho_old):
+            cho[:n_old, :n_old] = cho_old
+        cho[:n_old, n_old:] = 0.0
+        cho[n_old:, :n_old] = cho_old_new.T
+        cho[n_old:, n_old:] = cho_new_new
+        return cho, True
 
     @staticmethod
     def gram_cho_solve(
-        gram_cho_factor: Tuple[np.ndarray, bool], z: np.ndarray
+        gram_cho_factor: Tuple[np.ndarray, bool],
+        z: np.ndarray,
+        overwrite_z: bool = False,
     ) -> np.ndarray:
         """Wrapper for scipy.linalg.cho_solve. Meant to be used for linear systems of
         the gram matrix. Requires the solution of scipy.linalg.cho_factor as input.
 
+        The inputs are not checked for infs and NaNs.
+
         Parameters
         ----------
         gram_cho_factor
             The return object of compute_gram_cho_factor.
         z
             An array of appropriate shape.
+        overwrite_z
+            Whether ``z`` may be overwritten. The system is solved in place if ``z``
+            is also Fortran-contiguous.
 
         Returns
         -------
@@ -100,4 +198,6 @@ class BQBeliefUpdate(abc.ABC):
             The solution ``x`` to the linear system ``gram x = z``.
 
         """
-        return cho_solve(gram_cho_factor, z)
+        return cho_solve(
+            gram_cho_factor, z, overwrite_b=overwrite_z, check_finite=False
+        )
@@ -0,0 +1,261 @@
+"""Belief update for Bayesian quadrature with a sparse Gaussian process."""
+
+from __future__ import annotations
+
+from typing import Optional, Tuple
+
+import numpy as np
+from scipy.linalg import cho_factor, solve_triangular
+
+from probnum.quad.kernel_embeddings import KernelEmbedding
+from probnum.quad.solvers._bq_state import BQState
+from probnum.quad.solvers.initial_designs import InitialDesign
+from probnum.randprocs.kernels import Kernel
+from probnum.randvars import Normal
+from probnum.typing import FloatLike
+
+from ._belief_update import BQBeliefUpdate
+
+
+# pylint: disable=too-few-public-methods
+class BQSparseBeliefUpdate(BQBeliefUpdate):
+    r"""Updates integral belief and state using Bayesian quadrature based on a sparse
+    Gaussian process with inducing nodes. [1]_
+
+    The Gram matrix :math:`K_{nn}` of the :math:`n` nodes is replaced by its Nyström
+    approximation :math:`Q_{nn} = K_{nm} K_{mm}^{-1} K_{mn}` through :math:`m`
+    inducing nodes, plus a diagonal correction :math:`\Lambda`. The
+    deterministic training conditional (DTC) uses :math:`\Lambda = \epsilon I`, where
+    :math:`\epsilon` is the jitter. The fully independent training conditional (FITC)
+    [2]_ additionally keeps the exact prior variances, i.e.,
+    :math:`\Lambda = \operatorname{diag}(K_{nn} - Q_{nn}) + \epsilon I`.
+
+    Since :math:`\Lambda` is diagonal, the posterior only depends on the sums
+    :math:`K_{mn} \Lambda^{-1} K_{nm}` and :math:`K_{mn} \Lambda^{-1} y` over the
+    nodes, which are accumulated in the BQ state. An update with :math:`b` new nodes
+    thus costs :math:`\mathcal{O}(b m^2 + m^3)` instead of :math:`\mathcal{O}(n^3)`,
+    independently of the number of previous nodes, and no :math:`n \times n` matrix
+    is stored. All nodes are only revisited if the kernel changes.
+
+    The inducing nodes are generated by an initial design on the first update and
+    kept afterwards. The returned states hold the quantities of the inducing nodes in
+    the ``inducing_*`` attributes, while ``gram``, ``gram_cho_factor`` and
+    ``kernel_means`` are not available.
+
+    Parameters
+    ----------
+    jitter
+        Non-negative jitter to numerically stabilise kernel matrix inversion.
+    scale_estimation
+        Estimation method to use to compute the scale parameter.
+    inducing_design
+        The design generating the inducing nodes.
+    approximation
+        The sparse approximation, either ``"fitc"`` or ``"dtc"``. Defaults to
+        ``"fitc"``.
+
+    Raises
+    ------
+    ValueError
+        If the ``approximation`` is unknown.
+
+    References
+    ----------
+    .. [1] Quiñonero-Candela and Rasmussen, A Unifying View of Sparse Approximate
+       Gaussian Process Regression, *JMLR*, 2005.
+    .. [2] Snelson and Ghahramani, Sparse Gaussian Processes using Pseudo-inputs,
+       *NeurIPS*, 2006.
+    """
+
+    def __init__(
+        self,
+        jitter: FloatLike,
+        scale_estimation: Optional[str],
+        inducing_design: InitialDesign,
+        approximation: str = "fitc",
+    ) -> None:
+        if approximation not in ("fitc", "dtc"):
+            raise ValueError(f"The sparse approximation ({approximation}) is unknown.")
+
+        super().__init__(jitter=jitter)
+        self.scale_estimation = scale_estimation
+        self.inducing_design = inducing_design
+        self.approximation = approximation
+
+    @property
+    def requires_rng(self) -> bool:
+        return self.inducing_design.requires_rng
+
+    # pylint: disable=too-many-locals
+    def __call__(
+        self,
+        bq_state: BQState,
+        new_nodes: np.ndarray,
+        new_fun_evals: np.ndarray,
+        *args,
+        rng: Optional[np.random.Generator] = None,
+        **kwargs,
+    ) -> Tuple[Normal, BQState]:
+
+        self._check_fun_evals(new_fun_evals)
+
+        # Update nodes and function evaluations in place of the preallocated storage.
+        # No storage for Gram matrices of the nodes is needed.
+        num_old = bq_state.fun_evals.shape[0]
+        num_new = new_fun_evals.shape[0]
+        num_total = num_old + num_new
+        # pylint: disable=protected-access
+        buffers = bq_state._reserve(num_new, with_gram=False)
+        buffers.nodes[num_old:num_total] = new_nodes
+        buffers.fun_evals[num_old:num_total] = new_fun_evals
+        nodes = buffers.nodes[:num_total]
+        fun_evals = buffers.fun_evals[:num_total]
+
+        # The quantities of the inducing nodes only change with the kernel. If they
+        # are unchanged, only the contributions of the new nodes are accumulated.
+        kernel = bq_state.kernel
+        if (
+            bq_state.inducing_nodes is not None
+            and bq_state.kernel_embedding.kernel is kernel
+            and bq_state.kernel_embedding.measure is bq_state.measure
+        ):
+            inducing_nodes = bq_state.inducing_nodes
+            kernel_embedding = bq_state.kernel_embedding
+            gram_cho_factor = bq_state.inducing_gram_cho_factor
+            kernel_means = bq_state.inducing_kernel_means
+            cross_precision, cross_fun_evals, fun_evals_norm = self._accumulate(
+                kernel, inducing_nodes, gram_cho_factor, new_nodes, new_fun_evals
+            )
+            cross_precision += bq_state.inducing_cross_precision
+            cross_fun_evals += bq_state.inducing_cross_fun_evals
+            fun_evals_norm += bq_state.fun_evals_precision_norm
+        else:
+            inducing_nodes = bq_state.inducing_nodes
+            if inducing_nodes is None:
+                if self.requires_rng and rng is None:
+                    raise ValueError(
+                        f"The inducing design "
+                        f"'{self.inducing_design.__class__.__name__}' requires a "
+                        f"random number generator (rng) to be given."
+                    )
+                inducing_nodes = self.inducing_design(rng)
+            kernel_embedding = KernelEmbedding(kernel, bq_state.measure)
+            gram_cho_factor = self.compute_gram_cho_factor(
+                kernel.matrix(inducing_nodes)
+            )
+            kernel_means = kernel_embedding.kernel_mean(inducing_nodes)
+            cross_precision, cross_fun_evals, fun_evals_norm = self._accumulate(
+                kernel, inducing_nodes, gram_cho_factor, nodes, fun_evals
+            )
+
+        # Factor of the m x m system matrix I + A A^T of the approximate posterior
+        system_cho, _ = cho_factor(
+            np.eye(inducing_nodes.shape[0]) + cross_precision,
+            lower=True,
+            check_finite=False,
+        )
+        fun_evals_weights = solve_triangular(
+            system_cho, cross_fun_evals, lower=True, check_finite=False
+        )
+
+        # Whitened kernel means
+        kernel_means_white = solve_triangular(
+            gram_cho_factor[0], kernel_means, lower=True, check_finite=False
+        )
+        weights = solve_triangular(
+            system_cho, kernel_means_white, lower=True, check_finite=False
+        )
+
+        # Estimate scaling parameter
+        if self.scale_estimation is None:
+            new_scale_sq = bq_state.scale_sq
+        elif self.scale_estimation == "mle":
+            new_scale_sq = (
+                fun_evals_norm - fun_evals_weights @ fun_evals_weights
+            ) / num_total
+        else:
+            raise ValueError(f"Scale estimation ({self.scale_estimation}) is unknown.")
+
+        # Integral mean and variance
+        integral_mean = weights @ fun_evals_weights
+        integral_variance = new_scale_sq * (
+            kernel_embedding.kernel_variance()
+            - kernel_means_white @ kernel_means_white
+            + weights @ weights
+        )
+
+        new_belief = Normal(integral_mean, integral_variance)
+        new_state = BQState.from_new_data(
+            kernel=kernel,
+            scale_sq=new_scale_sq,
+            nodes=nodes,
+            fun_evals=fun_evals,
+            integral_belief=new_belief,
+            prev_state=bq_state,
+            inducing_nodes=inducing_nodes,
+            inducing_gram_cho_factor=gram_cho_factor,
+            inducing_kernel_means=kernel_means,
+            inducing_cross_precision=cross_precision,
+            inducing_cross_fun_evals=cross_fun_evals,
+            fun_evals_precision_norm=fun_evals_norm,
+        )
+
+        return new_belief, new_state
+
+    def _accumulate(
+        self,
+        kernel: Kernel,
+        inducing_nodes: np.ndarray,
+        gram_cho_factor: Tuple[np.ndarray, bool],
+        nodes: np.ndarray,
+        fun_evals: np.ndarray,
+    ) -> Tuple[np.ndarray, np.ndarray, float]:
+        r"""Sums over the given nodes that the approximate posterior depends on.
+
+        Parameters
+        ----------
+        kernel
+            The kernel.
+        inducing_nodes
+            *shape=(m, input_dim)* -- The inducing nodes.
+        gram_cho_factor
+            The lower Cholesky factor :math:`L` of the Gram matrix of the inducing
+            nodes.
+        nodes
+            *shape=(b, input_dim)* -- The nodes.
+        fun_evals
+            *shape=(b,)* -- The function evaluations at the nodes.
+
+        Returns
+        -------
+        cross_precision :
+            *shape=(m, m)* -- :math:`A A^T` with
+            :math:`A = L^{-1} K_{mb} \Lambda^{-1/2}`.
+        cross_fun_evals :
+            *shape=(m,)* -- :math:`A \Lambda^{-1/2} y`.
+        fun_evals_norm :
+            :math:`y^T \Lambda^{-1} y`.
+        """
+        # Whitened cross-covariances of the inducing nodes and the nodes
+        cross = solve_triangular(
+            gram_cho_factor[0],
+            kernel.matrix(inducing_nodes, nodes),
+            lower=True,
+            overwrite_b=True,
+            check_finite=False,
+        )
+
+        diag_correction = np.full(fun_evals.shape, self.jitter)
+        if self.approximation == "fitc":
+            diag_correction += np.maximum(
+                kernel(nodes, None) - np.einsum("ij,ij->j", cross, cross), 0.0
+            )
+        diag_correction_sqrt = np.sqrt(diag_correction)
+
+        cross /= diag_correction_sqrt
+        fun_evals_scaled = fun_evals / diag_correction_sqrt
+        return (
+            cross @ cross.T,
+            cross @ fun_evals_scaled,
+            fun_evals_scaled @ fun_evals_scaled,
+        )
@@ -6,6 +6,7 @@ from typing import Optional, Tuple
 
 import numpy as np
 
+from probnum import config
 from probnum.quad.kernel_embeddings import KernelEmbedding
 from probnum.quad.solvers._bq_state import BQState
 from probnum.randprocs.kernels import Kernel
@@ -13,6 +14,7 @@ from probnum.randvars import Normal
 from probnum.typing import FloatLike
 
 from ._belief_update import BQBeliefUpdate
+from ._standard_update_jax import gram_cho_solve_padded
 
 
 # pylint: disable=too-few-public-methods
@@ -42,43 +44,95 @@ class BQStandardBeliefUpdate(BQBeliefUpdate):
         **kwargs,
     ) -> Tuple[Normal, BQState]:
 
-        # Update nodes and function evaluations
-        nodes = np.concatenate((bq_state.nodes, new_nodes), axis=0)
-        fun_evals = np.append(bq_state.fun_evals, new_fun_evals)
+        # The linear algebra below skips finiteness checks. Only the new function
+        # evaluations need to be checked, all other quantities are finite.
+        self._check_fun_evals(new_fun_evals)
 
         # Estimate intrinsic kernel parameters
         new_kernel, kernel_was_updated = self._estimate_kernel(bq_state.kernel)
-        new_kernel_embedding = KernelEmbedding(new_kernel, bq_state.measure)
 
-        # Update gram matrix and kernel mean vector. Recompute everything from
-        # scratch if the kernel was updated or if these are the first nodes.
-        if kernel_was_updated or bq_state.nodes.size == 0:
-            gram = new_kernel.matrix(nodes)
-            kernel_means = new_kernel_embedding.kernel_mean(nodes)
+        # The cached Gram matrix and kernel means are only valid for the kernel and
+        # measure of the embedding they were computed with. States of a sparse
+        # approximation do not hold them.
+        cache_is_valid = (
+            bq_state.inducing_nodes is None
+            and not kernel_was_updated
+            and bq_state.kernel_embedding.kernel is new_kernel
+            and bq_state.kernel_embedding.measure is bq_state.measure
+        )
+        if cache_is_valid:
+            new_kernel_embedding = bq_state.kernel_embedding
+        else:
+            new_kernel_embedding = KernelEmbedding(new_kernel, bq_state.measure)
+
+        # The Gram matrix, its Cholesky factor and the kernel mean vector are
+        # recomputed from scratch if the cache is invalid, if these are the first
+        # nodes, or if the available factor cannot be extended (upper triangular).
+        num_old = bq_state.fun_evals.shape[0]
+        num_new = new_fun_evals.shape[0]
+        num_total = num_old + num_new
+        recompute = (
+            not cache_is_valid or num_old == 0 or not bq_state.gram_cho_factor[1]
+        )
+
+        # Update nodes and function evaluations in place of the preallocated storage.
+        # Recomputed data must not overwrite the data of the given state.
+        # pylint: disable=protected-access
+        buffers = bq_state._reserve(num_new, discard_derived=recompute)
+        buffers.nodes[num_old:num_total] = new_nodes
+        buffers.fun_evals[num_old:num_total] = new_fun_evals
+        nodes = buffers.nodes[:num_total]
+        fun_evals = buffers.fun_evals[:num_total]
+
+        # Update gram matrix, its Cholesky factor and kernel mean vector. Unless they
+        # are recomputed, only the entries of the new nodes are computed.
+        gram = buffers.gram[:num_total, :num_total]
+        if recompute:
+            gram[:, :] = new_kernel.matrix(nodes)
+            gram_cho, lower = self.compute_gram_cho_factor(gram)
+            buffers.gram_cho[:num_total, :num_total] = gram_cho
+            gram_cho_factor = (buffers.gram_cho[:num_total, :num_total], lower)
+            buffers.kernel_means[:num_total] = new_kernel_embedding.kernel_mean(nodes)
         else:
             gram_new_new = new_kernel.matrix(new_nodes)
             gram_old_new = new_kernel.matrix(new_nodes, bq_state.nodes)
-            gram = np.hstack(
-                (
-                    np.vstack((bq_state.gram, gram_old_new)),
-                    np.vstack((gram_old_new.T, gram_new_new)),
-                )
+            gram[num_old:, :num_old] = gram_old_new
+            gram[:num_old, num_old:] = gram_old_new.T
+            gram[num_old:, num_old:] = gram_new_new
+            gram_cho_factor = self.update_gram_cho_factor(
+                bq_state.gram_cho_factor,
+                gram_old_new.T,
+                gram_new_new,
+                out=buffers.gram_cho[:num_total, :num_total],
             )
-            kernel_means = np.concatenate(
-                (
-                    bq_state.kernel_means,
-                    new_kernel_embedding.kernel_mean(new_nodes),
-                )
+            buffers.kernel_means[num_old:num_total] = new_kernel_embedding.kernel_mean(
+                new_nodes
             )
+        kernel_means = buffers.kernel_means[:num_total]
 
-        # Cholesky factorisation of the Gram matrix
-        gram_cho_factor = self.compute_gram_cho_factor(gram)
+        # Solve the Gram systems for the kernel means and, if the scale is estimated,
+        # the function evaluations.
+        if config.bq_belief_update_jax:
+            weights, fun_evals_weights = gram_cho_solve_padded(
+                buffers.gram_cho, num_total, buffers.kernel_means, buffers.fun_evals
+            )
+        elif self.scale_estimation == "mle":
+            rhs = buffers.gram_rhs(num_total, 2)
+            rhs[:, 0] = kernel_means
+            rhs[:, 1] = fun_evals
+            weights, fun_evals_weights = self.gram_cho_solve(
+                gram_cho_factor, rhs, overwrite_z=True
+            ).T
+        else:
+            rhs = buffers.gram_rhs(num_total, 1)[:, 0]
+            rhs[:] = kernel_means
+            weights = self.gram_cho_solve(gram_cho_factor, rhs, overwrite_z=True)
+            fun_evals_weights = None
 
         # Estimate scaling parameter
-        new_scale_sq = self._estimate_scale(fun_evals, gram_cho_factor, bq_state)
+        new_scale_sq = self._estimate_scale(fun_evals, fun_evals_weights, bq_state)
 
         # Integral mean and variance
-        weights = self.gram_cho_solve(gram_cho_factor, kernel_means)
         integral_mean = weights @ fun_evals
         initial_integral_variance = new_kernel_embedding.kernel_variance()
         integral_variance = new_scale_sq * (
@@ -111,18 +165,15 @@ class BQStandardBeliefUpdate(BQBeliefUpdate):
     def _estimate_scale(
         self,
         fun_evals: np.ndarray,
-        gram_cho_factor: Tuple[np.ndarray, bool],
+        fun_evals_weights: Optional[np.ndarray],
         bq_state: BQState,
     ) -> FloatLike:
-        """Estimate the scale parameter."""
+        """Estimate the scale parameter. ``fun_evals_weights`` is the solution of the
+        Gram system for the function evaluations."""
         if self.scale_estimation is None:
             new_scale_sq = bq_state.scale_sq
         elif self.scale_estimation == "mle":
-            new_scale_sq = (
-                fun_evals
-                @ self.gram_cho_solve(gram_cho_factor, fun_evals)
-                / fun_evals.shape[0]
-            )
+            new_scale_sq = fun_evals @ fun_evals_weights / fun_evals.shape[0]
         else:
             raise ValueError(f"Scale estimation ({self.scale_estimation}) is unknown.")
         return new_scale_sq
@@ -0,0 +1,89 @@
+"""JAX implementation of the linear solves of the standard BQ belief update."""
+
+import functools
+from typing import Callable, Tuple
+
+import numpy as np
+
+
+def _import_jax():
+    errormsg = (
+        "The JAX belief update requires jax. "
+        "Try disabling the config option 'bq_belief_update_jax', "
+        "or install `jax` via `pip install jax jaxlib`"
+    )
+
+    try:
+        import jax  # pylint: disable=import-outside-toplevel
+        from jax.config import config  # pylint: disable=import-outside-toplevel
+        import jax.numpy as jnp  # pylint: disable=import-outside-toplevel
+        import jax.scipy.linalg  # pylint: disable=import-outside-toplevel
+
+        config.update("jax_enable_x64", True)
+        return jax, jnp
+
+    except ImportError as err:
+        raise ImportError(errormsg) from err
+
+
+@functools.lru_cache(maxsize=None)
+def _jitted_gram_cho_solve() -> Callable:
+    """Compile the padded solve once. ``jax.jit`` retraces for new padded sizes."""
+    jax, jnp = _import_jax()
+
+    @jax.jit
+    def gram_cho_solve(cho, num_nodes, kernel_means, fun_evals):
+        size = fun_evals.shape[0]
+        mask = jnp.arange(size) < num_nodes
+
+        # Pad the factor with the identity and the right hand sides with zeros
+        cho = jnp.where(mask[:, None] & mask[None, :], jnp.tril(cho), jnp.eye(size))
+        rhs = jnp.where(
+            mask[:, None], jnp.stack((kernel_means, fun_evals), axis=1), 0.0
+        )
+
+        solution = jax.scipy.linalg.cho_solve((cho, True), rhs)
+        return solution[:, 0], solution[:, 1]
+
+    return gram_cho_solve
+
+
+def gram_cho_solve_padded(
+    cho: np.ndarray, num_nodes: int, kernel_means: np.ndarray, fun_evals: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Solve the Gram systems for the kernel means and function evaluations with JAX.
+
+    The inputs are the preallocated buffers of the BQ state of which only the leading
+    ``num_nodes`` entries are used. The systems are padded to the smallest power of
+    two not below ``num_nodes``, but at most to the buffer size. Hence, the
+    jit-compiled solve is reused across iterations, and its cost scales with the
+    number of nodes instead of the buffer size.
+
+    Parameters
+    ----------
+    cho
+        *shape=(capacity, capacity)* -- Buffer whose leading block holds the lower
+        Cholesky factor of the Gram matrix.
+    num_nodes
+        Number of nodes.
+    kernel_means
+        *shape=(capacity,)* -- Buffer holding the kernel means.
+    fun_evals
+        *shape=(capacity,)* -- Buffer holding the function evaluations.
+
+    Returns
+    -------
+    weights :
+        *shape=(num_nodes,)* -- The solution of the system for the kernel means.
+    fun_evals_weights :
+        *shape=(num_nodes,)* -- The solution of the system for the function
+        evaluations.
+    """
+    size = min(cho.shape[0], 1 << (int(num_nodes) - 1).bit_length())
+    weights, fun_evals_weights = _jitted_gram_cho_solve()(
+        cho[:size, :size], num_nodes, kernel_means[:size], fun_evals[:size]
+    )
+    return (
+        np.asarray(weights[:num_nodes]),
+        np.asarray(fun_evals_weights[:num_nodes]),
+    )
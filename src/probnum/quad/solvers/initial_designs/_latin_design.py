@@ -40,6 +40,10 @@ class LatinDesign(InitialDesign):
 
         super().__init__(measure=measure, num_nodes=num_nodes)
 
+        # The affine map from the unit cube to the domain is fixed.
+        self._domain_a = np.asarray(measure.domain[0], dtype=np.float64)
+        self._domain_width = measure.domain[1] - self._domain_a
+
     @property
     def requires_rng(self) -> bool:
         return True
@@ -47,4 +51,4 @@ class LatinDesign(InitialDesign):
     def __call__(self, rng: Optional[np.random.Generator]) -> np.ndarray:
         sampler = qmc.LatinHypercube(d=self.measure.input_dim, seed=rng)
         sample = sampler.random(n=self.num_nodes)
-        return qmc.scale(sample, self.measure.domain[0], self.measure.domain[1])
+        return self._domain_a + self._domain_width * sample
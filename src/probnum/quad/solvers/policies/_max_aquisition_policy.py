@@ -8,7 +8,8 @@ import numpy as np
 
 from probnum.quad.solvers._bq_state import BQState
 from probnum.quad.solvers.acquisition_functions import AcquisitionFunction
-from probnum.typing import IntLike
+from probnum.quad.solvers.belief_updates import BQStandardBeliefUpdate
+from probnum.typing import FloatLike, IntLike
 
 from ._policy import Policy
 
@@ -21,19 +22,27 @@ class RandomMaxAcquisitionPolicy(Policy):
     The candidate nodes are random draws from the integration measure. The node with the
     largest acquisition value is chosen.
 
+    Batches of more than one node are selected greedily. After a node is chosen, it is
+    added to a copy of the BQ state with the posterior mean as hallucinated function
+    value, and the next node maximizes the acquisition function given the hallucinated
+    state. The function is then evaluated at all nodes of the batch at once.
+
     Parameters
     ----------
     batch_size
-        Size of batch of nodes when calling the policy once (must be equal to 1).
+        Size of batch of nodes when calling the policy once.
     acquisition_func
         The acquisition function.
     n_candidates
         The number of candidate nodes.
+    jitter
+        Non-negative jitter to numerically stabilise the kernel matrix inversion of
+        the hallucinated states. Defaults to 1e-8.
 
     Raises
     ------
     ValueError
-        If ``batch_size`` is not 1, or if ``n_candidates`` is too small.
+        If ``batch_size`` or ``n_candidates`` is too small.
     """
 
     def __init__(
@@ -41,12 +50,12 @@ class RandomMaxAcquisitionPolicy(Policy):
         batch_size: IntLike,
         acquisition_func: AcquisitionFunction,
         n_candidates: IntLike,
+        jitter: FloatLike = 1.0e-8,
     ) -> None:
 
-        if batch_size != 1:
+        if batch_size < 1:
             raise ValueError(
-                f"RandomMaxAcquisitionPolicy can only be used with batch "
-                f"size 1 ({batch_size})."
+                f"The batch size ({batch_size}) must be equal or larger than 1."
             )
         if n_candidates < 1:
             raise ValueError(
@@ -57,6 +66,7 @@ class RandomMaxAcquisitionPolicy(Policy):
         super().__init__(batch_size=batch_size)
         self.acquisition_func = acquisition_func
         self.n_candidates = int(n_candidates)
+        self._gram_update = BQStandardBeliefUpdate(jitter=jitter, scale_estimation=None)
 
     @property
     def requires_rng(self) -> bool:
@@ -65,7 +75,69 @@ class RandomMaxAcquisitionPolicy(Policy):
     def __call__(
         self, bq_state: BQState, rng: Optional[np.random.Generator]
     ) -> np.ndarray:
-        random_nodes = bq_state.measure.sample(n_sample=self.n_candidates, rng=rng)
-        values = self.acquisition_func(random_nodes, bq_state)[0]
-        idx_max = int(np.argmax(values))
-        return random_nodes[idx_max, :][None, :]
+        nodes = np.empty((self.batch_size, bq_state.input_dim))
+        for i in range(self.batch_size):
+            if i > 0:
+                bq_state = self._hallucinate(bq_state, nodes[i - 1 : i])
+            random_nodes = bq_state.measure.sample(n_sample=self.n_candidates, rng=rng)
+            values = self.acquisition_func(random_nodes, bq_state)[0]
+            nodes[i] = random_nodes[int(np.argmax(values)), :]
+        return nodes
+
+    def _hallucinate(self, bq_state: BQState, new_nodes: np.ndarray) -> BQState:
+        """Add nodes with the posterior mean as function values to a copy of a state.
+
+        Only the quantities that acquisition functions depend on are updated. The
+        Cholesky factor of the Gram matrix is extended rather than recomputed.
+
+        Parameters
+        ----------
+        bq_state
+            State of the BQ belief.
+        new_nodes
+            *shape=(n_new, input_dim)* -- The nodes to add.
+
+        Returns
+        -------
+        hallucinated_state :
+            The state including ``new_nodes``.
+
+        Raises
+        ------
+        ValueError
+            If ``bq_state`` belongs to a sparse approximation (with inducing nodes).
+        """
+        if bq_state.inducing_nodes is not None:
+            raise ValueError(
+                "Nodes cannot be hallucinated for states of a sparse approximation."
+            )
+
+        kernel = bq_state.kernel
+        update = self._gram_update
+        nodes = np.concatenate((bq_state.nodes, new_nodes))
+
+        if bq_state.fun_evals.shape[0] == 0:
+            new_fun_evals = np.zeros(new_nodes.shape[0])
+        else:
+            gram_old_new = kernel.matrix(bq_state.nodes, new_nodes)
+            new_fun_evals = gram_old_new.T @ update.gram_cho_solve(
+                bq_state.gram_cho_factor, bq_state.fun_evals
+            )
+
+        # Only lower factors can be extended, otherwise (e.g. for states that were
+        # not created by a belief update) the factor is recomputed.
+        if bq_state.fun_evals.shape[0] > 0 and bq_state.gram_cho_factor[1]:
+            gram_cho_factor = update.update_gram_cho_factor(
+                bq_state.gram_cho_factor, gram_old_new, kernel.matrix(new_nodes)
+            )
+        else:
+            gram_cho_factor = update.compute_gram_cho_factor(kernel.matrix(nodes))
+
+        return BQState(
+            measure=bq_state.measure,
+            kernel=kernel,
+            scale_sq=bq_state.scale_sq,
+            nodes=nodes,
+            fun_evals=np.concatenate((bq_state.fun_evals, new_fun_evals)),
+            gram_cho_factor=gram_cho_factor,
+        )
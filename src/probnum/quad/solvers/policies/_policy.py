@@ -31,6 +31,13 @@ class Policy(abc.ABC):
         """Whether the policy requires a random number generator when called."""
         raise NotImplementedError
 
+    def reset(self) -> None:
+        """Reset the internal state of the policy.
+
+        Called once before each integration. Policies that keep state across calls
+        override this method.
+        """
+
     @abc.abstractmethod
     def __call__(
         self, bq_state: BQState, rng: Optional[np.random.Generator]
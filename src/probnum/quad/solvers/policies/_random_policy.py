@@ -25,21 +25,58 @@ class RandomPolicy(Policy):
         The sample function. Needs to have the following interface:
         `sample_func(batch_size: int, rng: np.random.Generator)` and return an array of
         shape (batch_size, input_dim).
+    num_pooled_batches
+        If given, the nodes of this many batches are drawn with a single call to
+        ``sample_func`` and handed out batch by batch on subsequent calls of the
+        policy with the same random number generator. Typically set to the maximal
+        number of iterations of the BQ loop. The pool is discarded by ``reset``.
+        Defaults to drawing every batch separately.
     """
 
     def __init__(
         self,
         batch_size: IntLike,
         sample_func: Callable,
+        num_pooled_batches: Optional[IntLike] = None,
     ) -> None:
         super().__init__(batch_size=batch_size)
         self.sample_func = sample_func
+        self.num_pooled_batches = (
+            None if num_pooled_batches is None else max(int(num_pooled_batches), 1)
+        )
+
+        self._pool = None
+        self._pool_rng = None
+        self._pool_cursor = 0
 
     @property
     def requires_rng(self) -> bool:
         return True
 
+    def reset(self) -> None:
+        """Discard the pooled nodes."""
+        self._pool = None
+        self._pool_rng = None
+        self._pool_cursor = 0
+
     def __call__(
         self, bq_state: BQState, rng: Optional[np.random.Generator]
     ) -> np.ndarray:
-        return self.sample_func(self.batch_size, rng=rng)
+        if self.num_pooled_batches is None:
+            return self.sample_func(self.batch_size, rng=rng)
+
+        # Draw a new pool if it is used up or was drawn with another generator.
+        if (
+            self._pool is None
+            or self._pool_rng is not rng
+            or self._pool_cursor == self._pool.shape[0]
+        ):
+            self._pool = self.sample_func(
+                self.num_pooled_batches * self.batch_size, rng=rng
+            )
+            self._pool_rng = rng
+            self._pool_cursor = 0
+
+        nodes = self._pool[self._pool_cursor : self._pool_cursor + self.batch_size]
+        self._pool_cursor += self.batch_size
+        return nodes
@@ -2,13 +2,15 @@
 
 from __future__ import annotations
 
-from typing import Optional
+import functools
+from typing import Callable, Optional
 
 import numpy as np
 
 from probnum.quad.integration_measures import IntegrationMeasure
 from probnum.quad.solvers._bq_state import BQState
 from probnum.typing import IntLike
+from probnum.utils._numba import import_numba, numba_is_available
 
 from ._policy import Policy
 
@@ -97,19 +99,43 @@ class VanDerCorputPolicy(Policy):
             Corput sequence.
         """
 
-        # pylint: disable=invalid-name
         if n_end is None:
             n_end = n_start + 1
-        vdc_seq = np.zeros((n_end - n_start,))
-        ind = 0
-        for m in range(n_start, n_end):
-            q = 0.0
-            base_inv = 0.5
-            n = m
-            while n != 0:
-                q = q + (n % 2) * base_inv
-                n = n // 2
-                base_inv = base_inv / 2.0
-            vdc_seq[ind] = q
-            ind += 1
-        return vdc_seq
+        return _vdc()(int(n_start), int(n_end), 2)
+
+
+def _vdc_vectorized(n_start: int, n_end: int, base: int) -> np.ndarray:
+    """Van der Corput sequence in base ``base``, vectorized over the elements."""
+    n = np.arange(n_start, n_end)
+    vdc_seq = np.zeros((n_end - n_start,))
+    base_inv = 1.0 / base
+    while np.any(n != 0):
+        vdc_seq += (n % base) * base_inv
+        n = n // base
+        base_inv = base_inv / base
+    return vdc_seq
+
+
+def _vdc_loop(n_start: int, n_end: int, base: int) -> np.ndarray:
+    """Van der Corput sequence in base ``base``, looping over the elements."""
+    # pylint: disable=invalid-name
+    vdc_seq = np.zeros((n_end - n_start,))
+    for ind in range(n_end - n_start):
+        q = 0.0
+        base_inv = 1.0 / base
+        n = n_start + ind
+        while n != 0:
+            q += (n % base) * base_inv
+            n = n // base
+            base_inv = base_inv / base
+        vdc_seq[ind] = q
+    return vdc_seq
+
+
+@functools.lru_cache(maxsize=None)
+def _vdc() -> Callable[[int, int, int], np.ndarray]:
+    """The digit reversal loop compiled on first use if numba is available, else the
+    vectorized implementation."""
+    if numba_is_available():
+        return import_numba().njit(cache=True)(_vdc_loop)
+    return _vdc_vectorized
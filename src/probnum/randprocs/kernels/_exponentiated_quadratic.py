@@ -1,12 +1,13 @@
 """Exponentiated quadratic kernel."""
 
-from typing import Optional
+from typing import Optional, Tuple
 
 import numpy as np
 
 from probnum.typing import ScalarLike, ShapeLike
 import probnum.utils as _utils
 
+from . import _expquad_numba
 from ._kernel import IsotropicMixin, Kernel
 
 
@@ -57,6 +58,91 @@ class ExpQuad(Kernel, IsotropicMixin):
                 shape=x0.shape[: x0.ndim - self.input_ndim],
             )
 
-        return np.exp(
-            -self._squared_euclidean_distances(x0, x1) / (2.0 * self.lengthscale**2)
-        )
+        pairwise_inputs = self._pairwise_inputs(x0, x1)
+
+        if pairwise_inputs is not None:
+            x0, x1 = pairwise_inputs
+            symmetric = _same_memory(x0, x1)
+
+            if _expquad_numba.numba_is_available():
+                lengthscale = float(self.lengthscale)
+
+                # pylint: disable=protected-access
+                if symmetric:
+                    return _expquad_numba._gram_symmetric(x0, lengthscale)
+                return _expquad_numba._cross(x0, x1, lengthscale)
+
+            sqdists = _squared_distances_blas(x0, None if symmetric else x1)
+        else:
+            sqdists = self._squared_euclidean_distances(x0, x1)
+
+        return np.exp(-sqdists / (2.0 * self.lengthscale**2))
+
+    def _pairwise_inputs(
+        self, x0: np.ndarray, x1: np.ndarray
+    ) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """Extract the two sets of points from the inputs of a kernel matrix evaluation.
+
+        Returns ``None`` if the inputs are not of the form ``x0[:, None]`` and
+        ``x1[None, :]`` for C-contiguous, double precision point sets ``x0`` and ``x1``
+        of shapes ``(M, D)`` and ``(N, D)``.
+        """
+        if (
+            self.input_ndim != 1
+            or x0.ndim != 3
+            or x1.ndim != 3
+            or x0.shape[1] != 1
+            or x1.shape[0] != 1
+        ):
+            return None
+
+        x0, x1 = x0[:, 0], x1[0]
+
+        for x in (x0, x1):
+            if x.dtype != np.float64 or not x.flags.c_contiguous:
+                return None
+
+        return x0, x1
+
+
+# Number of rows per block when adding squared norms to symmetric distance matrices
+_SQDISTS_BLOCK_SIZE = 128
+
+
+def _squared_distances_blas(x0: np.ndarray, x1: Optional[np.ndarray]) -> np.ndarray:
+    r"""Pairwise squared Euclidean distances of two sets of points.
+
+    Uses the identity :math:`\lVert x - y \rVert_2^2 = \lVert x \rVert_2^2
+    + \lVert y \rVert_2^2 - 2 x^\top y` such that the bulk of the computation is a
+    single matrix product. If ``x1`` is ``None``, the distances of ``x0`` to itself are
+    computed, and the result is exactly symmetric.
+    """
+    sqnorms0 = np.einsum("ij,ij->i", x0, x0)
+
+    if x1 is None:
+        # ``x0 @ x0.T`` is symmetric. The squared norms are summed before they are
+        # added, such that rounding keeps the symmetry. This is done for blocks of
+        # rows to avoid a temporary of the size of the matrix.
+        sqdists = x0 @ x0.T
+        sqdists *= -2.0
+        for start in range(0, sqdists.shape[0], _SQDISTS_BLOCK_SIZE):
+            stop = start + _SQDISTS_BLOCK_SIZE
+            sqdists[start:stop] += sqnorms0[start:stop, None] + sqnorms0[None, :]
+        np.fill_diagonal(sqdists, 0.0)
+    else:
+        sqdists = x0 @ x1.T
+        sqdists *= -2.0
+        sqdists += sqnorms0[:, None]
+        sqdists += np.einsum("ij,ij->i", x1, x1)[None, :]
+
+    # Cancellation may produce small negative values
+    return np.maximum(sqdists, 0.0, out=sqdists)
+
+
+def _same_memory(x0: np.ndarray, x1: np.ndarray) -> bool:
+    """Whether two arrays are views of the same data with the same memory layout."""
+    return (
+        x0.shape == x1.shape
+        and x0.strides == x1.strides
+        and x0.ctypes.data == x1.ctypes.data
+    )
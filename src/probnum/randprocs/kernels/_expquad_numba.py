@@ -0,0 +1,59 @@
+"""Numba implementations of exponentiated quadratic kernel matrices.
+
+The compiled functions live in :mod:`._expquad_numba_kernels`, which is only imported
+(together with numba) on the first kernel matrix call.
+"""
+
+from typing import Callable, Tuple
+
+import numpy as np
+
+from probnum.utils._numba import numba_is_available  # pylint: disable=unused-import
+
+
+def _kernel_matrix_functions(input_dim: int) -> Tuple[Callable, Callable]:
+    """Kernel matrix functions specialized to the input dimension if available."""
+    # pylint: disable=import-outside-toplevel
+    from ._expquad_numba_kernels import KERNEL_MATRIX_FUNCTIONS
+
+    return KERNEL_MATRIX_FUNCTIONS.get(input_dim, KERNEL_MATRIX_FUNCTIONS[None])
+
+
+def _gram_symmetric(x: np.ndarray, lengthscale: float) -> np.ndarray:
+    """Exponentiated quadratic kernel matrix of a set of points with itself.
+
+    Parameters
+    ----------
+    x
+        *shape=(N, D)* -- Points.
+    lengthscale
+        Lengthscale of the kernel.
+
+    Returns
+    -------
+    kernmat :
+        *shape=(N, N)* -- The kernel matrix.
+    """
+    gram_symmetric, _ = _kernel_matrix_functions(x.shape[1])
+    return gram_symmetric(x, lengthscale)
+
+
+def _cross(x0: np.ndarray, x1: np.ndarray, lengthscale: float) -> np.ndarray:
+    """Exponentiated quadratic kernel matrix between two sets of points.
+
+    Parameters
+    ----------
+    x0
+        *shape=(M, D)* -- First set of points.
+    x1
+        *shape=(N, D)* -- Second set of points.
+    lengthscale
+        Lengthscale of the kernel.
+
+    Returns
+    -------
+    kernmat :
+        *shape=(M, N)* -- The kernel matrix.
+    """
+    _, cross = _kernel_matrix_functions(x0.shape[1])
+    return cross(x0, x1, lengthscale)
@@ -0,0 +1,251 @@
+"""Numba kernels of exponentiated quadratic kernel matrices.
+
+This module imports numba. It is only imported by :mod:`._expquad_numba` once a kernel
+matrix is computed with numba.
+
+The squared distances of points of small input dimension are computed by unrolled
+sums, for which specialized versions of the kernel matrix functions are compiled. All
+functions are defined at module level without closures, such that numba's on-disk
+cache is reused across processes.
+"""
+
+from typing import Callable, Dict, Optional, Tuple
+
+import numba
+import numpy as np
+
+# pylint: disable=not-an-iterable
+
+
+@numba.njit(inline="always")
+def _squared_distance(x0, i, x1, j):
+    sqdist = 0.0
+    for k in range(x0.shape[1]):
+        diff = x0[i, k] - x1[j, k]
+        sqdist += diff * diff
+    return sqdist
+
+
+@numba.njit(inline="always")
+def _squared_distance_1d(x0, i, x1, j):
+    diff0 = x0[i, 0] - x1[j, 0]
+    return diff0 * diff0
+
+
+@numba.njit(inline="always")
+def _squared_distance_2d(x0, i, x1, j):
+    diff0 = x0[i, 0] - x1[j, 0]
+    diff1 = x0[i, 1] - x1[j, 1]
+    return diff0 * diff0 + diff1 * diff1
+
+
+@numba.njit(inline="always")
+def _squared_distance_3d(x0, i, x1, j):
+    diff0 = x0[i, 0] - x1[j, 0]
+    diff1 = x0[i, 1] - x1[j, 1]
+    diff2 = x0[i, 2] - x1[j, 2]
+    return diff0 * diff0 + diff1 * diff1 + diff2 * diff2
+
+
+@numba.njit(inline="always")
+def _squared_distance_4d(x0, i, x1, j):
+    diff0 = x0[i, 0] - x1[j, 0]
+    diff1 = x0[i, 1] - x1[j, 1]
+    diff2 = x0[i, 2] - x1[j, 2]
+    diff3 = x0[i, 3] - x1[j, 3]
+    return diff0 * diff0 + diff1 * diff1 + diff2 * diff2 + diff3 * diff3
+
+
+@numba.njit(inline="always")
+def _squared_distance_5d(x0, i, x1, j):
+    diff0 = x0[i, 0] - x1[j, 0]
+    diff1 = x0[i, 1] - x1[j, 1]
+    diff2 = x0[i, 2] - x1[j, 2]
+    diff3 = x0[i, 3] - x1[j, 3]
+    diff4 = x0[i, 4] - x1[j, 4]
+    return diff0 * diff0 + diff1 * diff1 + diff2 * diff2 + diff3 * diff3 + diff4 * diff4
+
+
+@numba.njit(parallel=True, fastmath=True, cache=True)
+def _gram_symmetric(x: np.ndarray, lengthscale: float) -> np.ndarray:
+    num_points = x.shape[0]
+    scale = -0.5 / lengthscale**2
+    kernmat = np.empty((num_points, num_points))
+
+    for i in numba.prange(num_points):
+        kernmat[i, i] = 1.0
+        for j in range(i):
+            kernmat[i, j] = np.exp(scale * _squared_distance(x, i, x, j))
+            kernmat[j, i] = kernmat[i, j]
+
+    return kernmat
+
+
+@numba.njit(parallel=True, fastmath=True, cache=True)
+def _cross(x0: np.ndarray, x1: np.ndarray, lengthscale: float) -> np.ndarray:
+    num_points_0 = x0.shape[0]
+    num_points_1 = x1.shape[0]
+    scale = -0.5 / lengthscale**2
+    kernmat = np.empty((num_points_0, num_points_1))
+
+    for i in numba.prange(num_points_0):
+        for j in range(num_points_1):
+            kernmat[i, j] = np.exp(scale * _squared_distance(x0, i, x1, j))
+
+    return kernmat
+
+
+@numba.njit(parallel=True, fastmath=True, cache=True)
+def _gram_symmetric_1d(x: np.ndarray, lengthscale: float) -> np.ndarray:
+    num_points = x.shape[0]
+    scale = -0.5 / lengthscale**2
+    kernmat = np.empty((num_points, num_points))
+
+    for i in numba.prange(num_points):
+        kernmat[i, i] = 1.0
+        for j in range(i):
+            kernmat[i, j] = np.exp(scale * _squared_distance_1d(x, i, x, j))
+            kernmat[j, i] = kernmat[i, j]
+
+    return kernmat
+
+
+@numba.njit(parallel=True, fastmath=True, cache=True)
+def _cross_1d(x0: np.ndarray, x1: np.ndarray, lengthscale: float) -> np.ndarray:
+    num_points_0 = x0.shape[0]
+    num_points_1 = x1.shape[0]
+    scale = -0.5 / lengthscale**2
+    kernmat = np.empty((num_points_0, num_points_1))
+
+    for i in numba.prange(num_points_0):
+        for j in range(num_points_1):
+            kernmat[i, j] = np.exp(scale * _squared_distance_1d(x0, i, x1, j))
+
+    return kernmat
+
+
+@numba.njit(parallel=True, fastmath=True, cache=True)
+def _gram_symmetric_2d(x: np.ndarray, lengthscale: float) -> np.ndarray:
+    num_points = x.shape[0]
+    scale = -0.5 / lengthscale**2
+    kernmat = np.empty((num_points, num_points))
+
+    for i in numba.prange(num_points):
+        kernmat[i, i] = 1.0
+        for j in range(i):
+            kernmat[i, j] = np.exp(scale * _squared_distance_2d(x, i, x, j))
+            kernmat[j, i] = kernmat[i, j]
+
+    return kernmat
+
+
+@numba.njit(parallel=True, fastmath=True, cache=True)
+def _cross_2d(x0: np.ndarray, x1: np.ndarray, lengthscale: float) -> np.ndarray:
+    num_points_0 = x0.shape[0]
+    num_points_1 = x1.shape[0]
+    scale = -0.5 / lengthscale**2
+    kernmat = np.empty((num_points_0, num_points_1))
+
+    for i in numba.prange(num_points_0):
+        for j in range(num_points_1):
+            kernmat[i, j] = np.exp(scale * _squared_distance_2d(x0, i, x1, j))
+
+    return kernmat
+
+
+@numba.njit(parallel=True, fastmath=True, cache=True)
+def _gram_symmetric_3d(x: np.ndarray, lengthscale: float) -> np.ndarray:
+    num_points = x.shape[0]
+    scale = -0.5 / lengthscale**2
+    kernmat = np.empty((num_points, num_points))
+
+    for i in numba.prange(num_points):
+        kernmat[i, i] = 1.0
+        for j in range(i):
+            kernmat[i, j] = np.exp(scale * _squared_distance_3d(x, i, x, j))
+            kernmat[j, i] = kernmat[i, j]
+
+    return kernmat
+
+
+@numba.njit(parallel=True, fastmath=True, cache=True)
+def _cross_3d(x0: np.ndarray, x1: np.ndarray, lengthscale: float) -> np.ndarray:
+    num_points_0 = x0.shape[0]
+    num_points_1 = x1.shape[0]
+    scale = -0.5 / lengthscale**2
+    kernmat = np.empty((num_points_0, num_points_1))
+
+    for i in numba.prange(num_points_0):
+        for j in range(num_points_1):
+            kernmat[i, j] = np.exp(scale * _squared_distance_3d(x0, i, x1, j))
+
+    return kernmat
+
+
+@numba.njit(parallel=True, fastmath=True, cache=True)
+def _gram_symmetric_4d(x: np.ndarray, lengthscale: float) -> np.ndarray:
+    num_points = x.shape[0]
+    scale = -0.5 / lengthscale**2
+    kernmat = np.empty((num_points, num_points))
+
+    for i in numba.prange(num_points):
+        kernmat[i, i] = 1.0
+        for j in range(i):
+            kernmat[i, j] = np.exp(scale * _squared_distance_4d(x, i, x, j))
+            kernmat[j, i] = kernmat[i, j]
+
+    return kernmat
+
+
+@numba.njit(parallel=True, fastmath=True, cache=True)
+def _cross_4d(x0: np.ndarray, x1: np.ndarray, lengthscale: float) -> np.ndarray:
+    num_points_0 = x0.shape[0]
+    num_points_1 = x1.shape[0]
+    scale = -0.5 / lengthscale**2
+    kernmat = np.empty((num_points_0, num_points_1))
+
+    for i in numba.prange(num_points_0):
+        for j in range(num_points_1):
+            kernmat[i, j] = np.exp(scale * _squared_distance_4d(x0, i, x1, j))
+
+    return kernmat
+
+
+@numba.njit(parallel=True, fastmath=True, cache=True)
+def _gram_symmetric_5d(x: np.ndarray, lengthscale: float) -> np.ndarray:
+    num_points = x.shape[0]
+    scale = -0.5 / lengthscale**2
+    kernmat = np.empty((num_points, num_points))
+
+    for i in numba.prange(num_points):
+        kernmat[i, i] = 1.0
+        for j in range(i):
+            kernmat[i, j] = np.exp(scale * _squared_distance_5d(x, i, x, j))
+            kernmat[j, i] = kernmat[i, j]
+
+    return kernmat
+
+
+@numba.njit(parallel=True, fastmath=True, cache=True)
+def _cross_5d(x0: np.ndarray, x1: np.ndarray, lengthscale: float) -> np.ndarray:
+    num_points_0 = x0.shape[0]
+    num_points_1 = x1.shape[0]
+    scale = -0.5 / lengthscale**2
+    kernmat = np.empty((num_points_0, num_points_1))
+
+    for i in numba.prange(num_points_0):
+        for j in range(num_points_1):
+            kernmat[i, j] = np.exp(scale * _squared_distance_5d(x0, i, x1, j))
+
+    return kernmat
+
+
+# Kernel matrix functions by input dimension. ``None`` marks the generic functions.
+KERNEL_MATRIX_FUNCTIONS: Dict[Optional[int], Tuple[Callable, Callable]] = {
+    None: (_gram_symmetric, _cross),
+    1: (_gram_symmetric_1d, _cross_1d),
+    2: (_gram_symmetric_2d, _cross_2d),
+    3: (_gram_symmetric_3d, _cross_3d),
+    4: (_gram_symmetric_4d, _cross_4d),
+    5: (_gram_symmetric_5d, _cross_5d),
+}
@@ -0,0 +1,40 @@
+"""Lazy access to the optional dependency numba.
+
+Importing numba is slow. It is therefore only imported once a function compiled with
+numba is needed, and not on ``import probnum``.
+"""
+
+import functools
+from types import ModuleType
+from typing import Optional
+
+
+@functools.lru_cache(maxsize=None)
+def _import_numba() -> Optional[ModuleType]:
+    try:
+        import numba  # pylint: disable=import-outside-toplevel
+
+        return numba
+    except ImportError:
+        return None
+
+
+def numba_is_available() -> bool:
+    """Whether numba is installed. numba is imported on the first call."""
+    return _import_numba() is not None
+
+
+def import_numba() -> ModuleType:
+    """Import numba.
+
+    Raises
+    ------
+    ImportError
+        If numba is not installed.
+    """
+    numba = _import_numba()
+    if numba is None:
+        raise ImportError(
+            "This function requires numba. Install `numba` via `pip install numba`."
+        )
+    return numba
@@ -9,6 +9,7 @@ import pytest
 from probnum.quad.integration_measures import LebesgueMeasure
 from probnum.quad.solvers import BQState
 from probnum.quad.solvers.acquisition_functions import WeightedPredictiveVariance
+from probnum.quad.solvers.belief_updates import BQStandardBeliefUpdate
 from probnum.randprocs.kernels import ExpQuad
 from probnum.randvars import Normal
 
@@ -60,3 +61,26 @@ def test_acquisition_shapes(acquisition, input_dim, nevals, rng):
 def test_acquisition_property_values(acquisition):
     # no gradients yet. this may change (#581).
     assert not acquisition.has_gradients
+
+
+def test_weighted_predictive_variance_values(input_dim, rng):
+    """The batched evaluation must agree with the predictive variance computed for
+    each node separately."""
+    m = LebesgueMeasure(input_dim=input_dim, domain=(0, 1))
+    k = ExpQuad(input_shape=(input_dim,))
+    nodes = rng.uniform(size=(4, input_dim))
+    _, bq_state = BQStandardBeliefUpdate(jitter=1e-8, scale_estimation="mle")(
+        BQState(measure=m, kernel=k), nodes, rng.normal(size=4)
+    )
+
+    x = rng.uniform(size=(7, input_dim))
+    gram = k.matrix(nodes) + 1e-8 * np.eye(4)
+    expected = [
+        bq_state.scale_sq
+        * (k(xi, xi) - k.matrix(nodes, xi) @ np.linalg.solve(gram, k.matrix(nodes, xi)))
+        * m(xi[None, :])[0] ** 2
+        for xi in x
+    ]
+
+    values, _ = WeightedPredictiveVariance()(x, bq_state)
+    np.testing.assert_allclose(values, expected, rtol=1e-6, atol=1e-12)
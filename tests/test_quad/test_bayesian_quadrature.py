@@ -6,7 +6,10 @@ import pytest
 from probnum import LambdaStoppingCriterion
 from probnum.quad.integration_measures import LebesgueMeasure
 from probnum.quad.solvers import BayesianQuadrature
-from probnum.quad.solvers.belief_updates import BQStandardBeliefUpdate
+from probnum.quad.solvers.belief_updates import (
+    BQSparseBeliefUpdate,
+    BQStandardBeliefUpdate,
+)
 from probnum.quad.solvers.initial_designs import LatinDesign, MCDesign
 from probnum.quad.solvers.policies import (
     RandomMaxAcquisitionPolicy,
@@ -187,6 +190,43 @@ def test_bq_from_problem_options_custom_values(bq, bq_no_policy):
     )
     assert bq.policy.batch_size == batch_size
 
+    # samples of policy 'bmc' are pooled if max_evals is the only stopping criterion
+    bq = BayesianQuadrature.from_problem(
+        input_dim=2,
+        domain=(0, 1),
+        policy="bmc",
+        options=dict(batch_size=batch_size, max_evals=10),
+    )
+    assert bq.policy.num_pooled_batches == 4
+
+    bq = BayesianQuadrature.from_problem(
+        input_dim=2,
+        domain=(0, 1),
+        policy="bmc",
+        initial_design="mc",
+        options=dict(batch_size=batch_size, max_evals=10, num_initial_design_nodes=4),
+    )
+    assert bq.policy.num_pooled_batches == 2
+
+    bq = BayesianQuadrature.from_problem(
+        input_dim=2,
+        domain=(0, 1),
+        policy="bmc",
+        options=dict(batch_size=batch_size, max_evals=10**7, var_tol=1e-2),
+    )
+    assert bq.policy.num_pooled_batches is None
+
+    # sparse approximation
+    num_inducing = 7
+    bq = BayesianQuadrature.from_problem(
+        input_dim=2,
+        domain=(0, 1),
+        options=dict(sparse=True, num_inducing=num_inducing),
+    )
+    assert isinstance(bq.belief_update, BQSparseBeliefUpdate)
+    assert bq.belief_update.inducing_design.num_nodes == num_inducing
+    assert bq.belief_update.approximation == "fitc"
+
     # jitter manual value
     jitter = 1.3
     bq = BayesianQuadrature.from_problem(
@@ -243,6 +283,15 @@ def test_bq_from_problem_wrong_inputs(input_dim):
             initial_design="unknown_design",
         )
 
+    # sparse approximation with policy 'us_rand'
+    with pytest.raises(ValueError):
+        BayesianQuadrature.from_problem(
+            input_dim=input_dim,
+            domain=(0, 1),
+            policy="us_rand",
+            options=dict(sparse=True),
+        )
+
 
 # ========================================
 # Tests for 'integrate' method start here.
@@ -296,6 +345,23 @@ def test_integrate_output_shapes(initial_design_provided, nodes_provided, data,
 # Tests for 'integrate' input checks and exception raises start here.
 
 
+def test_integrate_capacity_covers_last_batch(rng):
+    """The preallocated storage must fit the last batch exceeding ``max_evals``."""
+    max_evals, batch_size = 10, 3
+    bq = BayesianQuadrature.from_problem(
+        input_dim=1,
+        domain=(0, 1),
+        policy="bmc",
+        options=dict(max_evals=max_evals, batch_size=batch_size),
+    )
+    _, bq_state, _ = bq.integrate(
+        fun=lambda x: np.sin(x[:, 0]), nodes=None, fun_evals=None, rng=rng
+    )
+
+    assert bq_state.nevals == 12
+    assert bq_state._buffers.capacity == max_evals + batch_size - 1
+
+
 def test_integrate_wrong_input(bq, data, rng):
     """Exception tests shared by all bq methods."""
     # The combination of inputs below is important to trigger the correct exception.
@@ -314,6 +380,15 @@ def test_integrate_wrong_input(bq, data, rng):
     with pytest.raises(ValueError):
         bq.integrate(fun=fun, nodes=nodes[:, None], fun_evals=None, rng=rng)
 
+    # wrong shape of the function evaluations returned by fun
+    with pytest.raises(ValueError, match="fun_evals must be one-dimensional"):
+        bq.integrate(
+            fun=lambda x: np.stack((fun(x), fun(x)), axis=1),
+            nodes=nodes,
+            fun_evals=None,
+            rng=rng,
+        )
+
     # number of points in nodes and fun_evals do not match
     wrong_nodes = np.vstack([nodes, np.ones([1, nodes.shape[1]])])
     with pytest.raises(ValueError):
@@ -365,3 +440,16 @@ def test_integrate_initial_design_wrong_input(rng):
         bq.integrate(
             fun=lambda x: np.ones(x.shape[0]), nodes=None, fun_evals=None, rng=None
         )
+
+
+def test_integrate_sparse_wrong_input(data):
+    """No rng provided but the sparse belief update requires it."""
+    nodes, fun_evals, _ = data
+    bq = BayesianQuadrature.from_problem(
+        input_dim=nodes.shape[1],
+        domain=(0, 1),
+        policy=None,
+        options=dict(sparse=True),
+    )
+    with pytest.raises(ValueError):
+        bq.integrate(fun=None, nodes=nodes, fun_evals=fun_evals, rng=None)
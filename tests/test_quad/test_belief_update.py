@@ -1,8 +1,29 @@
 """Test cases for the BQ belief updater."""
 
+import numpy as np
 import pytest
+from scipy.linalg import cho_solve
 
-from probnum.quad.solvers.belief_updates import BQStandardBeliefUpdate
+import probnum
+from probnum.quad.integration_measures import LebesgueMeasure
+from probnum.quad.kernel_embeddings import KernelEmbedding
+from probnum.quad.solvers import BQState
+from probnum.quad.solvers.belief_updates import (
+    BQSparseBeliefUpdate,
+    BQStandardBeliefUpdate,
+)
+from probnum.quad.solvers.initial_designs import MCDesign
+from probnum.randprocs.kernels import ExpQuad
+from probnum.randvars import Normal
+
+try:
+    import jax  # pylint: disable=unused-import
+
+    JAX_IS_AVAILABLE = True
+except ImportError:
+    JAX_IS_AVAILABLE = False
+
+only_if_jax_available = pytest.mark.skipif(not JAX_IS_AVAILABLE, reason="requires jax")
 
 
 def test_belief_update_raises():
@@ -10,3 +31,257 @@ def test_belief_update_raises():
     wrong_jitter = -1.0
     with pytest.raises(ValueError):
         BQStandardBeliefUpdate(jitter=wrong_jitter, scale_estimation="mle")
+
+    # unknown sparse approximation
+    measure = LebesgueMeasure(input_dim=1, domain=(0, 1))
+    with pytest.raises(ValueError):
+        BQSparseBeliefUpdate(
+            jitter=1e-8,
+            scale_estimation="mle",
+            inducing_design=MCDesign(5, measure),
+            approximation="unknown",
+        )
+
+
+@pytest.mark.parametrize("sparse", [False, True])
+@pytest.mark.parametrize("bad_value", [np.nan, np.inf])
+def test_belief_update_non_finite_fun_evals_raises(sparse, bad_value, rng):
+    input_dim = 2
+    measure = LebesgueMeasure(input_dim=input_dim, domain=(0, 1))
+    if sparse:
+        belief_update = BQSparseBeliefUpdate(
+            jitter=1e-8, scale_estimation="mle", inducing_design=MCDesign(3, measure)
+        )
+    else:
+        belief_update = BQStandardBeliefUpdate(jitter=1e-8, scale_estimation="mle")
+    bq_state = BQState(measure=measure, kernel=ExpQuad(input_shape=(input_dim,)))
+
+    fun_evals = rng.normal(size=4)
+    fun_evals[2] = bad_value
+    with pytest.raises(ValueError):
+        belief_update(bq_state, rng.uniform(size=(4, input_dim)), fun_evals, rng=rng)
+
+
+@pytest.mark.parametrize("num_new", [1, 3])
+def test_update_gram_cho_factor(num_new, rng):
+    """The extended Cholesky factor must match the factor of the extended Gram
+    matrix."""
+    num_old, input_dim = 6, 2
+    belief_update = BQStandardBeliefUpdate(jitter=1e-6, scale_estimation="mle")
+    kernel = ExpQuad(input_shape=(input_dim,))
+
+    nodes = rng.uniform(size=(num_old + num_new, input_dim))
+    gram = kernel.matrix(nodes)
+
+    gram_cho_factor = belief_update.update_gram_cho_factor(
+        belief_update.compute_gram_cho_factor(gram[:num_old, :num_old]),
+        gram[:num_old, num_old:],
+        gram[num_old:, num_old:],
+    )
+
+    assert gram_cho_factor[0].shape == gram.shape
+    assert gram_cho_factor[1]
+    np.testing.assert_allclose(
+        np.tril(gram_cho_factor[0]),
+        np.tril(belief_update.compute_gram_cho_factor(gram)[0]),
+        rtol=1e-6,
+        atol=1e-8,
+    )
+    z = rng.normal(size=num_old + num_new)
+    np.testing.assert_allclose(
+        cho_solve(gram_cho_factor, z),
+        cho_solve(belief_update.compute_gram_cho_factor(gram), z),
+        rtol=1e-6,
+    )
+
+
+def test_belief_update_from_same_state(rng):
+    """Updating the same state twice must not alter the first updated state."""
+    input_dim = 2
+    belief_update = BQStandardBeliefUpdate(jitter=1e-8, scale_estimation="mle")
+    bq_state = BQState(
+        measure=LebesgueMeasure(input_dim=input_dim, domain=(0, 1)),
+        kernel=ExpQuad(input_shape=(input_dim,)),
+        capacity=10,
+    )
+    _, bq_state = belief_update(
+        bq_state, rng.uniform(size=(3, input_dim)), rng.normal(size=3)
+    )
+
+    new_nodes = rng.uniform(size=(2, 1, input_dim))
+    belief_1, bq_state_1 = belief_update(bq_state, new_nodes[0], np.ones(1))
+    nodes_1, gram_1 = bq_state_1.nodes.copy(), bq_state_1.gram.copy()
+    _, bq_state_2 = belief_update(bq_state, new_nodes[1], np.zeros(1))
+    _, bq_state_11 = belief_update(bq_state_1, new_nodes[1], np.zeros(1))
+
+    np.testing.assert_equal(bq_state_1.nodes, nodes_1)
+    np.testing.assert_equal(bq_state_1.gram, gram_1)
+    np.testing.assert_equal(bq_state_1.fun_evals[-1], 1.0)
+    np.testing.assert_equal(bq_state_2.nodes[-1], new_nodes[1, 0])
+    np.testing.assert_equal(bq_state_2.fun_evals[-1], 0.0)
+    assert bq_state.nodes.shape == (3, input_dim)
+
+    # the integral beliefs of previous iterations are kept per state
+    assert len(bq_state.previous_integral_beliefs) == 1
+    for state in [bq_state_1, bq_state_2, bq_state_11]:
+        assert state.previous_integral_beliefs[0] is None
+        assert state.previous_integral_beliefs[1].mean == bq_state.integral_belief.mean
+    assert len(bq_state_11.previous_integral_beliefs) == 3
+    assert len(list(bq_state_11.previous_integral_beliefs[1:])) == 2
+    assert bq_state_11.previous_integral_beliefs[-1].mean == belief_1.mean
+    assert bq_state_11.previous_integral_beliefs[-1].var == belief_1.var
+
+
+def test_belief_update_keeps_nan_integral_beliefs(rng):
+    """A previous integral belief with NaN mean must be kept and not be treated as
+    missing."""
+    input_dim = 2
+    belief_update = BQStandardBeliefUpdate(jitter=1e-8, scale_estimation="mle")
+    bq_state = BQState(
+        measure=LebesgueMeasure(input_dim=input_dim, domain=(0, 1)),
+        kernel=ExpQuad(input_shape=(input_dim,)),
+        capacity=10,
+    )
+    _, bq_state = belief_update(
+        bq_state, rng.uniform(size=(3, input_dim)), rng.normal(size=3)
+    )
+    bq_state.integral_belief = Normal(np.nan, 1.0)
+    _, bq_state = belief_update(bq_state, rng.uniform(size=(1, input_dim)), np.ones(1))
+
+    previous_integral_beliefs = bq_state.previous_integral_beliefs
+    assert previous_integral_beliefs[0] is None
+    assert np.isnan(previous_integral_beliefs[1].mean)
+    assert previous_integral_beliefs[1].var == 1.0
+    assert previous_integral_beliefs[:1][0] is None
+
+
+def test_belief_update_recomputes_stale_cache(rng):
+    """Kernel means and Gram matrix must be recomputed for all nodes if the kernel of
+    the state does not match the one they were computed with."""
+    input_dim = 2
+    measure = LebesgueMeasure(input_dim=input_dim, domain=(0, 1))
+    belief_update = BQStandardBeliefUpdate(jitter=1e-8, scale_estimation="mle")
+    _, bq_state = belief_update(
+        BQState(measure=measure, kernel=ExpQuad(input_shape=(input_dim,)), capacity=10),
+        rng.uniform(size=(3, input_dim)),
+        rng.normal(size=3),
+    )
+
+    gram = bq_state.gram.copy()
+    gram_cho = bq_state.gram_cho_factor[0].copy()
+    kernel_means = bq_state.kernel_means.copy()
+
+    new_kernel = ExpQuad(input_shape=(input_dim,), lengthscale=0.3)
+    bq_state.kernel = new_kernel
+    _, new_bq_state = belief_update(
+        bq_state, rng.uniform(size=(1, input_dim)), np.ones(1)
+    )
+
+    np.testing.assert_allclose(new_bq_state.gram, new_kernel.matrix(new_bq_state.nodes))
+    np.testing.assert_allclose(
+        new_bq_state.kernel_means,
+        KernelEmbedding(new_kernel, measure).kernel_mean(new_bq_state.nodes),
+    )
+
+    # the recomputation must not alter the previous state
+    np.testing.assert_equal(bq_state.gram, gram)
+    np.testing.assert_equal(bq_state.gram_cho_factor[0], gram_cho)
+    np.testing.assert_equal(bq_state.kernel_means, kernel_means)
+
+
+@only_if_jax_available
+@pytest.mark.parametrize("scale_estimation", [None, "mle"])
+@pytest.mark.parametrize("capacity", [10, 100])
+def test_belief_update_jax(scale_estimation, capacity, rng):
+    """The JAX belief update must agree with the NumPy one."""
+    input_dim = 2
+    belief_update = BQStandardBeliefUpdate(
+        jitter=1e-8, scale_estimation=scale_estimation
+    )
+    bq_state = BQState(
+        measure=LebesgueMeasure(input_dim=input_dim, domain=(0, 1)),
+        kernel=ExpQuad(input_shape=(input_dim,)),
+        capacity=capacity,
+    )
+    nodes = rng.uniform(size=(6, input_dim))
+    fun_evals = np.sin(nodes).sum(axis=1)
+
+    beliefs = []
+    for use_jax in [False, True]:
+        with probnum.config(bq_belief_update_jax=use_jax):
+            belief, state = belief_update(bq_state, nodes[:4], fun_evals[:4])
+            belief, state = belief_update(state, nodes[4:], fun_evals[4:])
+        beliefs.append(belief)
+
+    np.testing.assert_allclose(beliefs[1].mean, beliefs[0].mean, rtol=1e-8)
+    np.testing.assert_allclose(beliefs[1].var, beliefs[0].var, rtol=1e-6, atol=1e-12)
+
+
+@pytest.mark.parametrize("approximation", ["fitc", "dtc"])
+@pytest.mark.parametrize("scale_estimation", [None, "mle"])
+def test_sparse_belief_update_at_nodes(approximation, scale_estimation):
+    """The sparse belief must be exact if the inducing nodes are the nodes."""
+    input_dim, num_nodes = 2, 8
+    measure = LebesgueMeasure(input_dim=input_dim, domain=(0, 1))
+    bq_state = BQState(measure=measure, kernel=ExpQuad(input_shape=(input_dim,)))
+    sparse_update = BQSparseBeliefUpdate(
+        jitter=1e-10,
+        scale_estimation=scale_estimation,
+        inducing_design=MCDesign(num_nodes, measure),
+        approximation=approximation,
+    )
+    standard_update = BQStandardBeliefUpdate(
+        jitter=1e-10, scale_estimation=scale_estimation
+    )
+
+    # inducing nodes and nodes are drawn from identically seeded generators
+    nodes = measure.sample(num_nodes, rng=np.random.default_rng(3))
+    fun_evals = np.sin(nodes).sum(axis=1)
+    belief, state = sparse_update(
+        bq_state, nodes[:5], fun_evals[:5], rng=np.random.default_rng(3)
+    )
+    belief, state = sparse_update(state, nodes[5:], fun_evals[5:])
+    belief_standard, _ = standard_update(bq_state, nodes, fun_evals)
+
+    np.testing.assert_allclose(state.inducing_nodes, nodes)
+    assert state.inducing_gram_cho_factor[0].shape == (num_nodes, num_nodes)
+    np.testing.assert_allclose(belief.mean, belief_standard.mean, rtol=1e-6)
+    np.testing.assert_allclose(belief.var, belief_standard.var, rtol=1e-3, atol=1e-12)
+
+
+@pytest.mark.parametrize("approximation", ["fitc", "dtc"])
+def test_sparse_belief_update_batches(approximation, rng):
+    """Accumulating the nodes batch by batch must give the same belief as adding them
+    at once, and must not alter previous states."""
+    input_dim, num_nodes = 2, 12
+    measure = LebesgueMeasure(input_dim=input_dim, domain=(0, 1))
+    bq_state = BQState(measure=measure, kernel=ExpQuad(input_shape=(input_dim,)))
+    sparse_update = BQSparseBeliefUpdate(
+        jitter=1e-6,
+        scale_estimation="mle",
+        inducing_design=MCDesign(5, measure),
+        approximation=approximation,
+    )
+    nodes = rng.uniform(size=(num_nodes, input_dim))
+    fun_evals = np.sin(nodes).sum(axis=1)
+
+    belief, state = sparse_update(
+        bq_state, nodes, fun_evals, rng=np.random.default_rng(3)
+    )
+    _, first_state = sparse_update(
+        bq_state, nodes[:4], fun_evals[:4], rng=np.random.default_rng(3)
+    )
+    cross_precision = first_state.inducing_cross_precision.copy()
+    _, state_batches = sparse_update(first_state, nodes[4:9], fun_evals[4:9])
+    belief_batches, state_batches = sparse_update(
+        state_batches, nodes[9:], fun_evals[9:]
+    )
+
+    np.testing.assert_allclose(belief_batches.mean, belief.mean, rtol=1e-10)
+    np.testing.assert_allclose(belief_batches.var, belief.var, rtol=1e-8)
+    np.testing.assert_equal(state_batches.nodes, nodes)
+    assert len(state_batches.previous_integral_beliefs) == 3
+
+    # previous states are unchanged
+    np.testing.assert_equal(first_state.nodes, nodes[:4])
+    np.testing.assert_equal(first_state.inducing_cross_precision, cross_precision)
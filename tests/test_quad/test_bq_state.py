@@ -1,5 +1,7 @@
 """Basic tests for the BQ info container and BQ state."""
 
+from collections.abc import Sequence
+
 import numpy as np
 import pytest
 
@@ -108,7 +110,7 @@ def test_state_defaults_types(state, request):
     assert isinstance(s.gram_cho_factor[0], np.ndarray)
     assert isinstance(s.gram_cho_factor[1], bool)
     assert isinstance(s.kernel_means, np.ndarray)
-    assert isinstance(s.previous_integral_beliefs, tuple)
+    assert isinstance(s.previous_integral_beliefs, Sequence)
     assert isinstance(s.scale_sq, float)
     assert s.integral_belief is None
 
@@ -183,7 +185,7 @@ def test_state_from_new_data(state, request):
     assert isinstance(s.gram_cho_factor[1], bool)
     assert isinstance(s.kernel_means, np.ndarray)
     assert isinstance(s.integral_belief, Normal)
-    assert isinstance(s.previous_integral_beliefs, tuple)
+    assert isinstance(s.previous_integral_beliefs, Sequence)
 
     # shapes
     assert s.nodes.shape == (new_nevals, s.input_dim)
@@ -196,3 +198,34 @@ def test_state_from_new_data(state, request):
     # values
     assert s.input_dim == s.measure.input_dim
     assert s.scale_sq == scale_sq
+
+
+def test_state_from_new_data_keeps_kernel_embedding(bq_state):
+    nevals = bq_state.fun_evals.shape[0]
+    s = BQState.from_new_data(
+        kernel=bq_state.kernel,
+        scale_sq=1.0,
+        nodes=bq_state.nodes,
+        fun_evals=bq_state.fun_evals,
+        integral_belief=Normal(0, 1),
+        prev_state=bq_state,
+        gram=np.eye(nevals),
+        gram_cho_factor=(np.eye(nevals), True),
+        kernel_means=np.ones(nevals),
+    )
+    assert s.kernel_embedding is bq_state.kernel_embedding
+
+    # a new kernel requires a new embedding
+    s = BQState.from_new_data(
+        kernel=ExpQuad(input_shape=(s.input_dim,), lengthscale=0.5),
+        scale_sq=1.0,
+        nodes=bq_state.nodes,
+        fun_evals=bq_state.fun_evals,
+        integral_belief=Normal(0, 1),
+        prev_state=bq_state,
+        gram=np.eye(nevals),
+        gram_cho_factor=(np.eye(nevals), True),
+        kernel_means=np.ones(nevals),
+    )
+    assert s.kernel_embedding is not bq_state.kernel_embedding
+    assert s.kernel_embedding.kernel is s.kernel
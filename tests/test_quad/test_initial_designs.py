@@ -6,6 +6,7 @@
 
 from typing import Tuple
 
+import numpy as np
 import pytest
 
 from probnum.quad.integration_measures import GaussianMeasure, LebesgueMeasure
@@ -70,3 +71,12 @@ def test_latin_design_wrong_domain(gaussian_measure, num_nodes):
     # Latin design requires finite domain but Gaussian measure has infinite domain)
     with pytest.raises(ValueError):
         LatinDesign(num_nodes, gaussian_measure)
+
+
+def test_latin_design_stratification(input_dim, num_nodes, rng):
+    # every one of the ``num_nodes`` strata of each dimension contains exactly one node
+    measure = LebesgueMeasure(domain=(-1.0, 3.0), input_dim=input_dim)
+    nodes = LatinDesign(num_nodes, measure)(rng)
+    strata = np.floor((nodes + 1.0) / 4.0 * num_nodes)
+    for dim in range(input_dim):
+        np.testing.assert_array_equal(np.sort(strata[:, dim]), np.arange(num_nodes))
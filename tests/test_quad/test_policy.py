@@ -7,14 +7,21 @@
 
 import numpy as np
 import pytest
+from scipy.linalg import cho_solve
 
 from probnum.quad.integration_measures import GaussianMeasure, LebesgueMeasure
 from probnum.quad.solvers import BQState
 from probnum.quad.solvers.acquisition_functions import WeightedPredictiveVariance
+from probnum.quad.solvers.belief_updates import (
+    BQSparseBeliefUpdate,
+    BQStandardBeliefUpdate,
+)
+from probnum.quad.solvers.initial_designs import MCDesign
 from probnum.quad.solvers.policies import (
     RandomMaxAcquisitionPolicy,
     RandomPolicy,
     VanDerCorputPolicy,
+    _van_der_corput_policy,
 )
 from probnum.randprocs.kernels import ExpQuad
 
@@ -73,9 +80,8 @@ def policy_params(policy_name, input_dim, batch_size, rng):
         params["input_dim"] = 1
         params["requires_rng"] = False
     elif policy_name == "RandomMaxAcquisitionPolicy":
-        # Since RandomMaxAcquisitionPolicy requires batch_size=1, we override it here.
         input_params = dict(
-            batch_size=1,
+            batch_size=batch_size,
             acquisition_func=WeightedPredictiveVariance(),
             n_candidates=10,
         )
@@ -123,6 +129,47 @@ def test_policy_property_values(policy):
     assert policy.requires_rng is params["requires_rng"]
 
 
+# Tests specific to RandomPolicy start here
+
+
+@pytest.mark.parametrize("batch_size", [1, 3])
+def test_random_policy_pooled_samples(batch_size, input_dim):
+    """Pooled samples must be handed out batch by batch, and must match per-batch
+    sampling for a uniform measure."""
+    num_batches = 4
+    measure = LebesgueMeasure(input_dim=input_dim, domain=(0, 1))
+    bq_state = BQState(measure=measure, kernel=ExpQuad(input_shape=(input_dim,)))
+    policy = RandomPolicy(batch_size, measure.sample)
+    pooled_policy = RandomPolicy(
+        batch_size, measure.sample, num_pooled_batches=num_batches - 1
+    )
+
+    rng, pooled_rng = np.random.default_rng(7), np.random.default_rng(7)
+    for _ in range(num_batches):
+        nodes = pooled_policy(bq_state, pooled_rng)
+        assert nodes.shape == (batch_size, input_dim)
+        np.testing.assert_array_equal(nodes, policy(bq_state, rng))
+
+    # another generator yields a new pool
+    pooled_rng = np.random.default_rng(8)
+    np.testing.assert_array_equal(
+        pooled_policy(bq_state, pooled_rng),
+        measure.sample(batch_size, rng=np.random.default_rng(8)),
+    )
+
+    # the pool is drawn anew after a reset
+    rng, pooled_rng = np.random.default_rng(9), np.random.default_rng(9)
+    pooled_policy.reset()
+    pooled_policy(bq_state, pooled_rng)
+    pooled_policy.reset()
+    pool_size = (num_batches - 1) * batch_size
+    measure.sample(pool_size, rng=rng)
+    np.testing.assert_array_equal(
+        pooled_policy(bq_state, pooled_rng),
+        measure.sample(pool_size, rng=rng)[:batch_size],
+    )
+
+
 # Tests specific to RandomMaxAcquisitionPolicy start here
 
 
@@ -137,9 +184,9 @@ def test_random_max_acquisition_attribute_values():
 
 
 def test_random_max_acquisition_raises():
-    # batch size larger than 1
+    # batch size too small
     with pytest.raises(ValueError):
-        wrong_batch_size = 2
+        wrong_batch_size = 0
         RandomMaxAcquisitionPolicy(
             batch_size=wrong_batch_size,
             acquisition_func=WeightedPredictiveVariance(),
@@ -156,6 +203,69 @@ def test_random_max_acquisition_raises():
         )
 
 
+def test_random_max_acquisition_hallucinated_state(rng):
+    """The hallucinated state must match the state conditioned on the posterior
+    mean at the new nodes."""
+    input_dim, nevals, n_new = 2, 5, 2
+    kernel = ExpQuad(input_shape=(input_dim,))
+    belief_update = BQStandardBeliefUpdate(jitter=1e-8, scale_estimation=None)
+    bq_state = BQState(
+        measure=LebesgueMeasure(input_dim=input_dim, domain=(0, 1)), kernel=kernel
+    )
+    _, bq_state = belief_update(
+        bq_state, rng.uniform(size=(nevals, input_dim)), rng.normal(size=nevals)
+    )
+    policy = RandomMaxAcquisitionPolicy(
+        batch_size=3, acquisition_func=WeightedPredictiveVariance(), n_candidates=10
+    )
+
+    new_nodes = rng.uniform(size=(n_new, input_dim))
+    hallucinated_state = policy._hallucinate(bq_state, new_nodes)
+    all_nodes = np.concatenate((bq_state.nodes, new_nodes))
+    gram_cho_factor = belief_update.compute_gram_cho_factor(kernel.matrix(all_nodes))
+
+    np.testing.assert_allclose(hallucinated_state.nodes, all_nodes)
+    np.testing.assert_allclose(
+        hallucinated_state.fun_evals[nevals:],
+        kernel.matrix(new_nodes, bq_state.nodes)
+        @ cho_solve(bq_state.gram_cho_factor, bq_state.fun_evals),
+    )
+    np.testing.assert_allclose(
+        np.tril(hallucinated_state.gram_cho_factor[0]),
+        np.tril(gram_cho_factor[0]),
+        rtol=1e-6,
+        atol=1e-8,
+    )
+
+    # batch nodes are distinct
+    batch = policy(bq_state, rng)
+    assert batch.shape == (3, input_dim)
+    assert np.unique(batch, axis=0).shape[0] == 3
+
+
+def test_random_max_acquisition_sparse_state_raises(rng):
+    """States of a sparse approximation hold no Gram matrix of the nodes."""
+    input_dim, nevals = 2, 5
+    measure = LebesgueMeasure(input_dim=input_dim, domain=(0, 1))
+    sparse_update = BQSparseBeliefUpdate(
+        jitter=1e-8, scale_estimation=None, inducing_design=MCDesign(nevals, measure)
+    )
+    _, bq_state = sparse_update(
+        BQState(measure=measure, kernel=ExpQuad(input_shape=(input_dim,))),
+        rng.uniform(size=(nevals, input_dim)),
+        rng.normal(size=nevals),
+        rng=rng,
+    )
+    policy = RandomMaxAcquisitionPolicy(
+        batch_size=2, acquisition_func=WeightedPredictiveVariance(), n_candidates=10
+    )
+
+    with pytest.raises(ValueError):
+        policy._hallucinate(bq_state, rng.uniform(size=(1, input_dim)))
+    with pytest.raises(ValueError):
+        policy(bq_state, rng)
+
+
 # Tests specific to VanDerCorputPolicy start here
 
 
@@ -196,6 +306,16 @@ def test_van_der_corput_partial():
     np.testing.assert_array_equal(vdc_seq, expected_seq)
 
 
+@pytest.mark.parametrize("base", [2, 3])
+def test_van_der_corput_implementations_agree(base):
+    """The loop (possibly compiled) and vectorized implementations must agree."""
+    # pylint: disable=protected-access
+    np.testing.assert_array_equal(
+        _van_der_corput_policy._vdc_loop(5, 300, base),
+        _van_der_corput_policy._vdc_vectorized(5, 300, base),
+    )
+
+
 def test_van_der_corput_start_value_only():
     """When no end value is given, test if sequence returns the correct value."""
     (n_start, n_end) = (1, 8)
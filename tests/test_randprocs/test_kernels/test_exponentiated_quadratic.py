@@ -0,0 +1,102 @@
+"""Test cases for the exponentiated quadratic kernel."""
+
+import os
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+
+from probnum.randprocs import kernels
+from probnum.randprocs.kernels import _expquad_numba
+
+
+@pytest.fixture(
+    params=[pytest.param(backend, id=backend) for backend in ["numba", "blas"]],
+    name="expquad",
+)
+def fixture_expquad(request, monkeypatch) -> kernels.ExpQuad:
+    """Exponentiated quadratic kernel evaluating kernel matrices with the given
+    backend."""
+    if request.param == "numba" and not _expquad_numba.numba_is_available():
+        pytest.skip("requires numba")
+    if request.param == "blas":
+        monkeypatch.setattr(_expquad_numba, "numba_is_available", lambda: False)
+
+    return kernels.ExpQuad(input_shape=(3,), lengthscale=0.7)
+
+
+def _expquad_matrix_naive(x0: np.ndarray, x1: np.ndarray, lengthscale: float):
+    sqdists = np.sum((x0[:, None, :] - x1[None, :, :]) ** 2, axis=-1)
+    return np.exp(-sqdists / (2.0 * lengthscale**2))
+
+
+@pytest.mark.parametrize("num_points", [1, 2, 17])
+def test_matrix_symmetric(expquad: kernels.ExpQuad, num_points: int, rng):
+    """Check the kernel matrix of a set of points with itself."""
+    x = rng.normal(size=(num_points, 3))
+    kernmat = expquad.matrix(x)
+
+    np.testing.assert_allclose(
+        kernmat, _expquad_matrix_naive(x, x, expquad.lengthscale), rtol=1e-12
+    )
+    np.testing.assert_array_equal(kernmat, kernmat.T)
+    np.testing.assert_array_equal(np.diag(kernmat), 1.0)
+
+
+@pytest.mark.parametrize("x0_contiguous", [True, False])
+def test_matrix_cross(expquad: kernels.ExpQuad, x0_contiguous: bool, rng):
+    """Check the kernel matrix between two sets of points, including non-contiguous
+    inputs."""
+    x0 = rng.normal(size=(11, 3)) if x0_contiguous else rng.normal(size=(3, 11)).T
+    x1 = rng.normal(size=(5, 3))
+
+    np.testing.assert_allclose(
+        expquad.matrix(x0, x1),
+        _expquad_matrix_naive(x0, x1, expquad.lengthscale),
+        rtol=1e-12,
+    )
+
+
+@pytest.mark.skipif(not _expquad_numba.numba_is_available(), reason="requires numba")
+@pytest.mark.parametrize("input_dim", [1, 2, 4, 5, 7])
+def test_matrix_input_dim_specializations(input_dim: int, rng):
+    """Check the kernel matrices compiled for specific and generic input
+    dimensions."""
+    expquad = kernels.ExpQuad(input_shape=(input_dim,), lengthscale=0.7)
+    x0 = rng.normal(size=(9, input_dim))
+    x1 = rng.normal(size=(4, input_dim))
+
+    np.testing.assert_allclose(
+        expquad.matrix(x0), _expquad_matrix_naive(x0, x0, 0.7), rtol=1e-12
+    )
+    np.testing.assert_allclose(
+        expquad.matrix(x0, x1), _expquad_matrix_naive(x0, x1, 0.7), rtol=1e-12
+    )
+
+
+@pytest.mark.skipif(not _expquad_numba.numba_is_available(), reason="requires numba")
+def test_numba_cache_reused_across_processes(tmp_path):
+    """The compiled kernel matrix functions must be loaded from numba's on-disk cache
+    by a second process."""
+    script = (
+        "import numpy as np\n"
+        "from probnum.randprocs.kernels import ExpQuad, _expquad_numba_kernels\n"
+        "ExpQuad(input_shape=(3,)).matrix(np.zeros((4, 3)))\n"
+        "stats = _expquad_numba_kernels._gram_symmetric_3d.stats\n"
+        "print(sum(stats.cache_hits.values()), sum(stats.cache_misses.values()))\n"
+    )
+    env = dict(os.environ, NUMBA_CACHE_DIR=str(tmp_path))
+
+    def run():
+        output = subprocess.run(
+            [sys.executable, "-c", script],
+            env=env,
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout
+        return tuple(int(count) for count in output.split())
+
+    run()
+    assert run() == (1, 0)